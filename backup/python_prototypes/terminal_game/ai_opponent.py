@@ -4,6 +4,7 @@ AI Opponent - Implements decision-making for the Corporation AI
 """
 
 import random
+from itertools import accumulate
 from enum import Enum
 
 class AIStrategy(Enum):
@@ -12,16 +13,18 @@ class AIStrategy(Enum):
     DEFENSIVE = 2     # Focus on strong ICE defense
     ECONOMIC = 3      # Focus on building economy first, then advancing
 
+# Card types the Corporation can draw in this prototype
+_CORP_CARD_TYPES = ('ice', 'agenda', 'asset', 'operation', 'upgrade')
+
 class AIOpponent:
     """Corporation AI opponent that makes strategic decisions"""
     
     def __init__(self, random_seed=None):
-        # Set random seed if provided
-        if random_seed is not None:
-            random.seed(random_seed)
+        # Private generator, seeded if provided, so the AI never touches global random state
+        self._rng = random.Random(random_seed)
             
         # AI state
-        self.strategy = random.choice(list(AIStrategy))
+        self.strategy = self._rng.choice(list(AIStrategy))
         self.credits = 5
         self.clicks = 3  # Corp starts with 3 clicks
         self.hand = []
@@ -34,9 +37,7 @@ class AIOpponent:
         self.scored_agendas = []
         self.deck = []
         self.discard = []
-        
-        # Debug info
-        print(f"AI initialized with strategy: {self.strategy.name}")
+        self._action_tables = {}  # State flags -> (actions, cumulative weights)
         
     def start_turn(self):
         """Start the Corp's turn"""
@@ -71,6 +72,27 @@ class AIOpponent:
         if len(self.hand) == 0 and self.clicks > 0:
             return "draw"
             
+        # Check for installable agendas and advanceable cards
+        has_agenda = any(card.get('type') == 'agenda' for card in self.hand)
+        has_advanceable = len(self.remote_servers) > 0 and any(
+            server.get('card', {}).get('type') == 'agenda' for server in self.remote_servers
+        )
+        
+        # The strategy is fixed, so these flags fully determine the weights;
+        # each combination is weighed once and then looked up
+        key = (self.credits < 3, len(self.hand) < 3, has_agenda, has_advanceable)
+        table = self._action_tables.get(key)
+        if table is None:
+            table = self._action_tables[key] = self._build_action_table(*key)
+        actions, cum_weights = table
+        
+        # Choose action based on weights with a single weighted draw
+        if not actions:
+            return "gain_credit"
+        return self._rng.choices(actions, cum_weights=cum_weights)[0]
+        
+    def _build_action_table(self, low_credits, small_hand, has_agenda, has_advanceable):
+        """Weigh the actions for one state and return (actions, cumulative weights) for those with weight > 0"""
         # Basic strategic weighting
         weights = {
             "draw": 10,
@@ -92,33 +114,22 @@ class AIOpponent:
             weights["install_ice"] += 20
         
         # Adjust weights based on current game state
-        if self.credits < 3:
+        if low_credits:
             weights["gain_credit"] += 15
             weights["install_ice"] -= 5
             weights["install_agenda"] -= 5
             
-        if len(self.hand) < 3:
+        if small_hand:
             weights["draw"] += 15
             
-        # Check for installable agendas and adjust weight
-        has_agenda = any(card.get('type') == 'agenda' for card in self.hand)
         if has_agenda:
             weights["install_agenda"] += 10
             
-        # Check for advanceable cards and adjust weight
-        has_advanceable = len(self.remote_servers) > 0 and any(
-            server.get('card', {}).get('type') == 'agenda' for server in self.remote_servers
-        )
         if has_advanceable:
             weights["advance"] += 15
             
-        # Choose action based on weights
-        actions = []
-        for action, weight in weights.items():
-            if weight > 0:
-                actions.extend([action] * weight)
-                
-        return random.choice(actions) if actions else "gain_credit"
+        actions = tuple(action for action, weight in weights.items() if weight > 0)
+        return actions, tuple(accumulate(weights[action] for action in actions))
         
     def _perform_action(self, action, game_state):
         """Perform the selected action and return a result string"""
@@ -137,7 +148,7 @@ class AIOpponent:
             if self.clicks > 0 and self.credits >= 1:
                 self.clicks -= 1
                 self.credits -= 1
-                server = random.choice(list(self.installed_ice.keys()))
+                server = self._rng.choice(list(self.installed_ice.keys()))
                 return f"Corporation installs ICE protecting {server}."
                 
         elif action == "install_agenda":
@@ -147,7 +158,7 @@ class AIOpponent:
                 server_num = len(self.remote_servers) + 1
                 self.remote_servers.append({
                     'name': f"Remote Server {server_num}",
-                    'card': {'type': 'agenda', 'advancement': 0, 'advancement_requirement': random.randint(2, 5)},
+                    'card': {'type': 'agenda', 'advancement': 0, 'advancement_requirement': self._rng.randint(2, 5)},
                     'ice': []
                 })
                 return f"Corporation installs a card in a new remote server."
@@ -175,12 +186,12 @@ class AIOpponent:
                 if advanceable_servers:
                     self.clicks -= 1
                     self.credits -= 1
-                    server = random.choice(advanceable_servers)
+                    server = self._rng.choice(advanceable_servers)
                     server['card']['advancement'] += 1
                     
                     # Check if agenda is fully advanced
                     if server['card']['advancement'] >= server['card']['advancement_requirement']:
-                        points = random.choice([1, 2, 3])  # Agendas are worth 1-3 points
+                        points = self._rng.choice([1, 2, 3])  # Agendas are worth 1-3 points
                         self.scored_agendas.append(points)
                         self.remote_servers.remove(server)
                         return f"Corporation advances and scores an agenda worth {points} points!"
@@ -198,10 +209,9 @@ class AIOpponent:
         """Draw a card from the deck"""
         # In a real implementation, this would draw from actual deck
         # For prototype, we'll simulate drawing generic cards
-        card_types = ['ice', 'agenda', 'asset', 'operation', 'upgrade']
         new_card = {
-            'type': random.choice(card_types),
-            'name': f"Card-{random.randint(1000, 9999)}"
+            'type': self._rng.choice(_CORP_CARD_TYPES),
+            'name': f"Card-{self._rng.randint(1000, 9999)}"
         }
         self.hand.append(new_card)
         return f"Corporation draws a card. ({len(self.hand)} cards in hand)"
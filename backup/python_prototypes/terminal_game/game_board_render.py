@@ -4,11 +4,15 @@ Game Board Renderer - Displays a game board using ASCII art
 Based on the existing terminal game's ASCII art
 """
 
+import functools
 import shutil
+import signal
 import random
+import re
 import sys
 import os
 import argparse
+from itertools import zip_longest
 
 # Import the card data and card ASCII art
 from card_data import load_cards, GAME_UI_ASCII
@@ -43,241 +47,374 @@ class Colors:
     BG_CYAN = "\033[46m"
     BG_WHITE = "\033[47m"
 
+# Colors are only noise when output is redirected or the user has opted out
+# (https://no-color.org), so every code becomes empty before anything uses them
+if os.environ.get("NO_COLOR") or not sys.stdout.isatty():
+    for _name in [name for name in vars(Colors) if not name.startswith("_")]:
+        setattr(Colors, _name, "")
+
+# ANSI color/style escape sequences, compiled once at import
+_ANSI_RE = re.compile(r'\033\[[0-9;]*m')
+
+# Display color for each (lowercase) card type; other types are uncolored
+_TYPE_COLORS = {
+    "program": Colors.BRIGHT_CYAN,
+    "hardware": Colors.BRIGHT_YELLOW,
+    "resource": Colors.BRIGHT_GREEN,
+    "event": Colors.BRIGHT_MAGENTA,
+    "virus": Colors.BRIGHT_RED,
+    "icebreaker": Colors.BRIGHT_BLUE,
+    "ice": Colors.BRIGHT_RED,
+    "operation": Colors.BRIGHT_BLUE,
+    "asset": Colors.BRIGHT_YELLOW,
+    "upgrade": Colors.BRIGHT_GREEN,
+    "agenda": Colors.BRIGHT_MAGENTA,
+}
+
 # Sample cards data
 sample_cards = load_cards()
 
+# Sample cards by name, for picking demonstration cards
+_CARDS_BY_NAME = {card["name"]: card for card in sample_cards}
+
 # Server data for demonstration
 server_data = {
     "HQ": {
-        "ice": [next(card for card in sample_cards if card["name"] == "Data Wall")],
-        "contents": [next(card for card in sample_cards if card["name"] == "Project Quantum"), 
-                     next(card for card in sample_cards if card["name"] == "Run Exploit")]
+        "ice": [_CARDS_BY_NAME["Data Wall"]],
+        "contents": [_CARDS_BY_NAME["Project Quantum"], 
+                     _CARDS_BY_NAME["Run Exploit"]]
     },
     "R&D": {
-        "ice": [next(card for card in sample_cards if card["name"] == "Data Wall"), 
-                next(card for card in sample_cards if card["name"] == "Digital Lockpick")],
-        "contents": [next(card for card in sample_cards if card["name"] == "Neural Matrix"), 
-                    next(card for card in sample_cards if card["name"] == "Quantum Protocol"), 
-                    next(card for card in sample_cards if card["name"] == "Project Quantum")]
+        "ice": [_CARDS_BY_NAME["Data Wall"], 
+                _CARDS_BY_NAME["Digital Lockpick"]],
+        "contents": [_CARDS_BY_NAME["Neural Matrix"], 
+                    _CARDS_BY_NAME["Quantum Protocol"], 
+                    _CARDS_BY_NAME["Project Quantum"]]
     },
     "Archives": {
         "ice": [],
-        "contents": [next(card for card in sample_cards if card["name"] == "Run Exploit"), 
-                     next(card for card in sample_cards if card["name"] == "Crypto Cache")]
+        "contents": [_CARDS_BY_NAME["Run Exploit"], 
+                     _CARDS_BY_NAME["Crypto Cache"]]
     },
     "Server 1": {
-        "ice": [next(card for card in sample_cards if card["name"] == "Digital Lockpick"), 
-                next(card for card in sample_cards if card["name"] == "Digital Lockpick"), 
-                next(card for card in sample_cards if card["name"] == "Data Wall")],
-        "contents": [next(card for card in sample_cards if card["name"] == "Project Quantum")]
+        "ice": [_CARDS_BY_NAME["Digital Lockpick"], 
+                _CARDS_BY_NAME["Digital Lockpick"], 
+                _CARDS_BY_NAME["Data Wall"]],
+        "contents": [_CARDS_BY_NAME["Project Quantum"]]
     }
 }
 
+# Terminal size, kept up to date by a SIGWINCH handler so frames need not
+# query it; empty when it has to be queried each frame instead
+_terminal_size = []
+
+# Clear the screen and home the cursor
+_CLEAR_SCREEN = "\033[2J\033[H"
+
+# Windows consoles only act on escape sequences once a console command has
+# switched VT processing on; an empty one is enough
+if os.name == 'nt':
+    os.system('')
+
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    sys.stdout.write(_CLEAR_SCREEN)
+    sys.stdout.flush()
+
+# Runs of spaces for padding, indexed by width
+_PAD = tuple(" " * n for n in range(256))
+
+def _pad(width):
+    """Return width spaces (none for a negative width) from the shared table"""
+    if 0 <= width < len(_PAD):
+        return _PAD[width]
+    return " " * width
+
+def visible_width(text):
+    """Return how many columns text occupies, not counting color codes"""
+    # Most text carries no escapes at all; skip the regex for it
+    if '\033' not in text:
+        return len(text)
+    return len(_ANSI_RE.sub('', text))
 
 def get_card_color(card_type):
     """Return ANSI color code based on card type"""
-    type_color = Colors.RESET
-    if card_type.lower() == "program":
-        type_color = Colors.BRIGHT_CYAN
-    elif card_type.lower() == "hardware":
-        type_color = Colors.BRIGHT_YELLOW
-    elif card_type.lower() == "resource":
-        type_color = Colors.BRIGHT_GREEN
-    elif card_type.lower() == "event":
-        type_color = Colors.BRIGHT_MAGENTA
-    elif card_type.lower() == "virus":
-        type_color = Colors.BRIGHT_RED
-    elif card_type.lower() == "icebreaker":
-        type_color = Colors.BRIGHT_BLUE
-    elif card_type.lower() == "ice":
-        type_color = Colors.BRIGHT_RED
-    elif card_type.lower() == "operation":
-        type_color = Colors.BRIGHT_BLUE
-    elif card_type.lower() == "asset":
-        type_color = Colors.BRIGHT_YELLOW
-    elif card_type.lower() == "upgrade":
-        type_color = Colors.BRIGHT_GREEN
-    elif card_type.lower() == "agenda":
-        type_color = Colors.BRIGHT_MAGENTA
-    return type_color
+    return _TYPE_COLORS.get(card_type.lower(), Colors.RESET)
 
 def display_mini_card(card, width=20):
     """Render a mini card with ASCII art"""
-    card_type = card.get('type', 'unknown').lower()
-    name = card.get('name', 'Unknown')
-    cost = card.get('cost', 0)
-    
+    # The board redraws the same cards every frame; everything the card
+    # looks like is captured in the key, so each distinct card renders once
+    lines = _render_mini_card(
+        card.get('type', 'unknown').lower(),
+        card.get('name', 'Unknown'),
+        card.get('cost', 0),
+        card.get('subtype', ''),
+        tuple(card.get('ascii_art', ())),
+        card.get('mu', 0),
+        card.get('strength'),
+        card.get('agenda_points'),
+        width,
+    )
+    return list(lines)
+
+@functools.lru_cache(maxsize=256)
+def _render_mini_card(card_type, name, cost, subtype, art_lines, mu, strength, agenda_points, width):
+    """Build the lines of a mini card from its display fields"""
     # Get card color
     type_color = get_card_color(card_type)
     
-    # Get card art directly from the card object
-    art_lines = card.get('ascii_art', [])
-    
     # Adjust width based on name length (minimum 20)
     card_width = max(width, len(name) + 4)
     
+    # Hoisted so each line is assembled from locals with a single join
+    reset = Colors.RESET
+    
     # Card lines to return
     card_lines = []
     
     # Top of card
-    card_lines.append(f"{type_color}╔{'═' * card_width}╗{Colors.RESET}")
+    card_lines.append("".join((type_color, "╔", "═" * card_width, "╗", reset)))
     
     # Card name
-    card_lines.append(f"{type_color}║{Colors.BOLD} {name}{' ' * (card_width - len(name) - 1)}{Colors.RESET}{type_color}║{Colors.RESET}")
+    card_lines.append("".join((
+        type_color, "║", Colors.BOLD, " ", name.ljust(card_width - 1),
+        reset, type_color, "║", reset
+    )))
     
     # Card type
-    subtype = card.get('subtype', '')
-    type_text = f"{card_type.capitalize()}{': ' + subtype if subtype else ''}"
-    card_lines.append(f"{type_color}║ {type_text}{' ' * (card_width - len(type_text) - 2)}║{Colors.RESET}")
-    
-    # Display ASCII art if available
-    if art_lines:
-        for line in art_lines:
-            padding = max(0, (card_width - len(line)) // 2)
-            card_lines.append(f"{type_color}║{' ' * padding}{line}{' ' * (card_width - len(line) - padding)}║{Colors.RESET}")
+    type_text = f"{card_type.capitalize()}: {subtype}" if subtype else card_type.capitalize()
+    card_lines.append("".join((
+        type_color, "║ ", type_text.ljust(card_width - 2), "║", reset
+    )))
+    
+    # Display ASCII art if available, centered with any odd space on the
+    # right (str.center would sometimes put it on the left)
+    for line in art_lines:
+        padding = max(0, (card_width - len(line)) // 2)
+        card_lines.append("".join((
+            type_color, "║", (_pad(padding) + line).ljust(card_width), "║", reset
+        )))
     
     # Display cost and other stats based on card type
-    stats_line = f" Cost: {cost}"
-    if 'mu' in card and card['mu'] > 0:
-        stats_line += f" | MU: {card['mu']}"
-    if 'strength' in card:
-        stats_line += f" | STR: {card['strength']}"
-    if 'agenda_points' in card:
-        stats_line += f" | Points: {card['agenda_points']}"
+    stats = [" Cost: ", str(cost)]
+    if mu > 0:
+        stats += (" | MU: ", str(mu))
+    if strength is not None:
+        stats += (" | STR: ", str(strength))
+    if agenda_points is not None:
+        stats += (" | Points: ", str(agenda_points))
+    stats_line = "".join(stats)
     
     if len(stats_line) > card_width - 2:
         stats_line = stats_line[:card_width - 5] + "..."
         
-    card_lines.append(f"{type_color}║{stats_line}{' ' * (card_width - len(stats_line) - 1)}║{Colors.RESET}")
+    card_lines.append("".join((
+        type_color, "║", stats_line.ljust(card_width - 1), "║", reset
+    )))
     
     # Bottom of card
-    card_lines.append(f"{type_color}╚{'═' * card_width}╝{Colors.RESET}")
+    card_lines.append("".join((type_color, "╚", "═" * card_width, "╝", reset)))
     
-    return card_lines
+    return tuple(card_lines)
 
 def merge_horizontally(lists_of_lines):
     """Merge multiple lists of lines horizontally"""
-    if not lists_of_lines:
-        return []
-        
-    max_height = max(len(lines) for lines in lists_of_lines)
-    result = []
-    
-    # Padding each list to max height
-    padded_lists = []
-    for lines in lists_of_lines:
-        padding_needed = max_height - len(lines)
-        padded = lines + [""] * padding_needed
-        padded_lists.append(padded)
-    
-    # Merging lines
-    for i in range(max_height):
-        merged_line = ""
-        for lines in padded_lists:
-            merged_line += lines[i] + "  "
-        result.append(merged_line)
-    
-    return result
-
-def display_servers(servers, current_run=None):
+    # Shorter lists are padded with empty cells; every cell keeps its
+    # two-space gutter, the last one included
+    return ["  ".join(row) + "  " for row in zip_longest(*lists_of_lines, fillvalue="")]
+
+def _buffered(display):
+    """
+    Let a display function write into a caller's frame buffer
+    
+    The wrapped function appends one string per terminal row to ``out``.
+    Called without a buffer it behaves as before: its rows are written to
+    stdout in a single write.
+    """
+    @functools.wraps(display)
+    def wrapper(*args, out=None, **kwargs):
+        if out is not None:
+            return display(*args, out=out, **kwargs)
+        rows = []
+        result = display(*args, out=rows, **kwargs)
+        write_frame(rows)
+        return result
+    return wrapper
+
+def write_frame(rows):
+    """Write buffered rows to the terminal in one write and flush"""
+    if rows:
+        sys.stdout.write("\n".join(rows) + "\n")
+    sys.stdout.flush()
+
+def _get_terminal_size():
+    """Return the terminal size, from the resize-maintained cache when there is one"""
+    if _terminal_size:
+        return _terminal_size[0]
+    return shutil.get_terminal_size()
+
+def _on_resize(signum, frame):
+    """Refresh the cached terminal size when the window changes"""
+    _terminal_size[:] = [shutil.get_terminal_size()]
+
+# Windows has no SIGWINCH, and only the main thread may set handlers; in
+# either case the size stays uncached
+try:
+    signal.signal(signal.SIGWINCH, _on_resize)
+    _terminal_size.append(shutil.get_terminal_size())
+except (AttributeError, ValueError):
+    pass
+
+def _add_block(out, lines):
+    """Append a block of merged card rows; an empty block still takes a row"""
+    out.extend(lines or [""])
+
+@_buffered
+def display_servers(servers, current_run=None, *, out):
     """Display corporate servers with their ICE and contents"""
-    print(f"\n{Colors.BRIGHT_WHITE}{Colors.BOLD}CORPORATE SERVERS{Colors.RESET}")
-    print(f"{Colors.BRIGHT_BLACK}{'=' * 80}{Colors.RESET}\n")
+    out.append("")
+    out.append(f"{Colors.BRIGHT_WHITE}{Colors.BOLD}CORPORATE SERVERS{Colors.RESET}")
+    out.append(f"{Colors.BRIGHT_BLACK}{'=' * 80}{Colors.RESET}")
+    out.append("")
     
     for server_name, server in servers.items():
-        # Highlight server if it's being run on
+        run_ice_index = None
         if current_run and current_run['server'] == server_name:
-            highlight = Colors.BG_BLUE + Colors.BRIGHT_WHITE + Colors.BOLD
-            print(f"{highlight}[ {server_name} - CURRENTLY RUNNING ]{Colors.RESET}")
-            
-            # Display run progress
-            display_run_progress(server['ice'], current_run['ice_index'], server_name)
-        else:
-            print(f"{Colors.YELLOW}{Colors.BOLD}[ {server_name} ]{Colors.RESET}")
-        
-        # Display ICE protecting the server
-        if server['ice']:
-            ice_cards = [display_mini_card(ice) for ice in server['ice']]
-            print("\n".join(merge_horizontally(ice_cards)))
-            print(f"{Colors.BRIGHT_BLACK}{'- ' * 40}{Colors.RESET}")
-        else:
-            print(f"{Colors.BRIGHT_GREEN}No ICE protecting this server{Colors.RESET}")
-            print(f"{Colors.BRIGHT_BLACK}{'- ' * 40}{Colors.RESET}")
-        
-        # Indicate server contents (but don't show details for hidden cards)
-        if server['contents']:
-            content_count = len(server['contents'])
-            print(f"{Colors.BRIGHT_BLUE}Server contains {content_count} cards{Colors.RESET}\n")
-        else:
-            print(f"{Colors.BRIGHT_BLACK}Server is empty{Colors.RESET}\n")
+            run_ice_index = current_run['ice_index']
+        out.extend(_server_rows(server_name, server, run_ice_index))
+
+# Rendered rows per (server name, run ICE index or None), stored with the ICE
+# and content count they were drawn from so a changed server is redrawn
+_server_row_cache = {}
+
+def _server_rows(server_name, server, run_ice_index):
+    """
+    Return the rows for one server, reusing the last rendering when possible
+    
+    During a run only the server being run changes from frame to frame, so
+    every other server is served from the cache. Card dicts are treated as
+    unchanging, as in the mini-card cache; a different ICE list or number of
+    contents invalidates the entry.
+    """
+    ice = tuple(server['ice'])
+    content_count = len(server['contents'])
+    key = (server_name, run_ice_index)
+    cached = _server_row_cache.get(key)
+    if (cached and cached[1] == content_count and len(cached[0]) == len(ice)
+            and all(old is new for old, new in zip(cached[0], ice))):
+        return cached[2]
+    
+    rows = []
+    
+    # Highlight server if it's being run on
+    if run_ice_index is not None:
+        highlight = Colors.BG_BLUE + Colors.BRIGHT_WHITE + Colors.BOLD
+        rows.append(f"{highlight}[ {server_name} - CURRENTLY RUNNING ]{Colors.RESET}")
         
-        print()
+        # Display run progress
+        display_run_progress(ice, run_ice_index, server_name, out=rows)
+    else:
+        rows.append(f"{Colors.YELLOW}{Colors.BOLD}[ {server_name} ]{Colors.RESET}")
+    
+    # Display ICE protecting the server
+    if ice:
+        rows.extend(merge_horizontally([display_mini_card(card) for card in ice]))
+        rows.append(f"{Colors.BRIGHT_BLACK}{'- ' * 40}{Colors.RESET}")
+    else:
+        rows.append(f"{Colors.BRIGHT_GREEN}No ICE protecting this server{Colors.RESET}")
+        rows.append(f"{Colors.BRIGHT_BLACK}{'- ' * 40}{Colors.RESET}")
+    
+    # Indicate server contents (but don't show details for hidden cards)
+    if content_count:
+        rows.append(f"{Colors.BRIGHT_BLUE}Server contains {content_count} cards{Colors.RESET}")
+    else:
+        rows.append(f"{Colors.BRIGHT_BLACK}Server is empty{Colors.RESET}")
+    rows.append("")
+    
+    rows.append("")
+    
+    rows = tuple(rows)
+    # Holding the ICE tuple keeps the cards alive, so identity checks stay valid
+    _server_row_cache[key] = (ice, content_count, rows)
+    return rows
 
-def display_runner_area(runner_cards):
+@_buffered
+def display_runner_area(runner_cards, *, out):
     """Display runner's installed cards and hand"""
-    print(f"\n{Colors.BRIGHT_WHITE}{Colors.BOLD}RUNNER'S RIG{Colors.RESET}")
-    print(f"{Colors.BRIGHT_BLACK}{'=' * 80}{Colors.RESET}\n")
-    
-    # Group cards by type
-    programs = [c for c in runner_cards if c.get('type').lower() in ['program']]
-    icebreakers = [c for c in runner_cards if c.get('subtype', '').lower() == 'icebreaker']
-    hardware = [c for c in runner_cards if c.get('type').lower() == 'hardware']
-    resources = [c for c in runner_cards if c.get('type').lower() == 'resource']
+    out.append("")
+    out.append(f"{Colors.BRIGHT_WHITE}{Colors.BOLD}RUNNER'S RIG{Colors.RESET}")
+    out.append(f"{Colors.BRIGHT_BLACK}{'=' * 80}{Colors.RESET}")
+    out.append("")
+    
+    # Group cards by type in one pass; icebreakers get their own group
+    # rather than also appearing among the programs
+    icebreakers, programs, hardware, resources = [], [], [], []
+    for card in runner_cards:
+        card_type = (card.get('type') or '').lower()
+        if (card.get('subtype') or '').lower() == 'icebreaker':
+            icebreakers.append(card)
+        elif card_type == 'program':
+            programs.append(card)
+        elif card_type == 'hardware':
+            hardware.append(card)
+        elif card_type == 'resource':
+            resources.append(card)
     
     # Display icebreakers
     if icebreakers:
-        print(f"{Colors.BRIGHT_BLUE}{Colors.BOLD}ICEBREAKERS:{Colors.RESET}")
+        out.append(f"{Colors.BRIGHT_BLUE}{Colors.BOLD}ICEBREAKERS:{Colors.RESET}")
         icebreaker_cards = [display_mini_card(prog) for prog in icebreakers]
-        print("\n".join(merge_horizontally(icebreaker_cards)))
-        print()
+        out.extend(merge_horizontally(icebreaker_cards))
+        out.append("")
         
     # Display programs
     if programs:
-        print(f"{Colors.BRIGHT_CYAN}{Colors.BOLD}PROGRAMS:{Colors.RESET}")
-        program_cards = [display_mini_card(prog) for prog in programs if 'icebreaker' not in prog.get('subtype', '').lower()]
-        print("\n".join(merge_horizontally(program_cards)))
-        print()
+        out.append(f"{Colors.BRIGHT_CYAN}{Colors.BOLD}PROGRAMS:{Colors.RESET}")
+        program_cards = [display_mini_card(prog) for prog in programs]
+        out.extend(merge_horizontally(program_cards))
+        out.append("")
     
     # Display hardware
     if hardware:
-        print(f"{Colors.BRIGHT_YELLOW}{Colors.BOLD}HARDWARE:{Colors.RESET}")
+        out.append(f"{Colors.BRIGHT_YELLOW}{Colors.BOLD}HARDWARE:{Colors.RESET}")
         hardware_cards = [display_mini_card(hw) for hw in hardware]
-        print("\n".join(merge_horizontally(hardware_cards)))
-        print()
+        out.extend(merge_horizontally(hardware_cards))
+        out.append("")
     
     # Display resources
     if resources:
-        print(f"{Colors.BRIGHT_GREEN}{Colors.BOLD}RESOURCES:{Colors.RESET}")
+        out.append(f"{Colors.BRIGHT_GREEN}{Colors.BOLD}RESOURCES:{Colors.RESET}")
         resource_cards = [display_mini_card(res) for res in resources]
-        print("\n".join(merge_horizontally(resource_cards)))
-        print()
+        out.extend(merge_horizontally(resource_cards))
+        out.append("")
 
-def display_status_bar(credits, memory, clicks):
+@_buffered
+def display_status_bar(credits, memory, clicks, *, out):
     """Display runner status information"""
-    terminal_width = shutil.get_terminal_size().columns
+    terminal_width = _get_terminal_size().columns
     
     status_text = f"Credits: {credits} │ Memory: {memory[0]}/{memory[1]} MU │ Clicks: {clicks}"
     
-    padding = " " * ((terminal_width - len(status_text)) // 2)
+    padding = _pad((terminal_width - visible_width(status_text)) // 2)
     
-    print(f"{Colors.BG_BLUE}{Colors.BRIGHT_WHITE}{padding}{status_text}{padding}{Colors.RESET}")
-    print()
+    out.append(f"{Colors.BG_BLUE}{Colors.BRIGHT_WHITE}{padding}{status_text}{padding}{Colors.RESET}")
+    out.append("")
 
-def display_logo():
+@_buffered
+def display_logo(*, out):
     """Display the game logo"""
     for line in GAME_UI_ASCII["logo"]:
-        print(f"{Colors.BRIGHT_CYAN}{line}{Colors.RESET}")
-    print()
+        out.append(f"{Colors.BRIGHT_CYAN}{line}{Colors.RESET}")
+    out.append("")
 
-def display_run_progress(ice_encountered, current_ice_index, server_name):
+@_buffered
+def display_run_progress(ice_encountered, current_ice_index, server_name, *, out):
     """Display a visual representation of the progress through a run"""
     total_ice = len(ice_encountered)
     if total_ice == 0:
         # No ICE on this server
-        print(f"{Colors.BRIGHT_GREEN}No ICE protecting {server_name}. Direct access!{Colors.RESET}")
+        out.append(f"{Colors.BRIGHT_GREEN}No ICE protecting {server_name}. Direct access!{Colors.RESET}")
         return
         
     # Calculate progress
@@ -285,85 +422,101 @@ def display_run_progress(ice_encountered, current_ice_index, server_name):
     remaining_ice = total_ice - passed_ice - 1
     
     # Header
-    print(f"\n{Colors.BRIGHT_BLUE}RUN PROGRESS: {Colors.RESET}{passed_ice}/{total_ice} ICE passed")
+    out.append("")
+    out.append(f"{Colors.BRIGHT_BLUE}RUN PROGRESS: {Colors.RESET}{passed_ice}/{total_ice} ICE passed")
     
-    # Print the starting point (Runner)
-    print(f"{Colors.BRIGHT_MAGENTA}[RUNNER]", end="")
+    # The track is one row, collected piece by piece
+    # Start with the starting point (Runner)
+    track = [f"{Colors.BRIGHT_MAGENTA}[RUNNER]"]
     
-    # Print passed ICE
+    # Passed ICE
     for i in range(passed_ice):
         ice_color = Colors.BRIGHT_GREEN
-        print(f"{Colors.BRIGHT_BLACK}==={Colors.RESET}{ice_color}[X]{Colors.RESET}", end="")
+        track.append(f"{Colors.BRIGHT_BLACK}==={Colors.RESET}{ice_color}[X]{Colors.RESET}")
         
-    # Print current ICE (if any)
+    # Current ICE (if any)
     if current_ice_index < total_ice:
         ice = ice_encountered[current_ice_index]
         ice_str = f"[!]"  # Default representation
         ice_color = Colors.BRIGHT_RED
-        print(f"{Colors.BRIGHT_BLACK}==={Colors.RESET}{ice_color}{ice_str}{Colors.RESET}", end="")
+        track.append(f"{Colors.BRIGHT_BLACK}==={Colors.RESET}{ice_color}{ice_str}{Colors.RESET}")
         
-        # Print remaining ICE
+        # Remaining ICE
         for i in range(current_ice_index + 1, total_ice):
-            print(f"{Colors.BRIGHT_BLACK}===[ ]{Colors.RESET}", end="")
+            track.append(f"{Colors.BRIGHT_BLACK}===[ ]{Colors.RESET}")
     
-    # Print the server
-    print(f"{Colors.BRIGHT_BLACK}==={Colors.RESET}{Colors.BRIGHT_CYAN}[{server_name}]{Colors.RESET}")
+    # Finish with the server
+    track.append(f"{Colors.BRIGHT_BLACK}==={Colors.RESET}{Colors.BRIGHT_CYAN}[{server_name}]{Colors.RESET}")
+    out.append("".join(track))
     
     # Show legend
-    print(f"{Colors.BRIGHT_GREEN}[X]{Colors.RESET} = Passed ICE   " +
-          f"{Colors.BRIGHT_RED}[!]{Colors.RESET} = Current ICE   " +
-          f"{Colors.BRIGHT_BLACK}[ ]{Colors.RESET} = Upcoming ICE\n")
+    out.append(f"{Colors.BRIGHT_GREEN}[X]{Colors.RESET} = Passed ICE   " +
+               f"{Colors.BRIGHT_RED}[!]{Colors.RESET} = Current ICE   " +
+               f"{Colors.BRIGHT_BLACK}[ ]{Colors.RESET} = Upcoming ICE")
+    out.append("")
 
-def display_ice_encounter(ice_card):
+@_buffered
+def display_ice_encounter(ice_card, *, out):
     """Display an ice encounter during a run"""
-    print(f"\n{Colors.BRIGHT_RED}{Colors.BOLD}!!! ICE ENCOUNTERED !!!{Colors.RESET}")
-    print(f"{Colors.BRIGHT_BLACK}{'=' * 80}{Colors.RESET}\n")
-    
-    card_lines = display_mini_card(ice_card, width=30)
+    out.append("")
+    out.append(f"{Colors.BRIGHT_RED}{Colors.BOLD}!!! ICE ENCOUNTERED !!!{Colors.RESET}")
+    out.append(f"{Colors.BRIGHT_BLACK}{'=' * 80}{Colors.RESET}")
+    out.append("")
     
     # Display ice card
-    for line in card_lines:
-        print(line)
+    out.extend(display_mini_card(ice_card, width=30))
     
-    print(f"\n{Colors.BRIGHT_WHITE}You must break the ICE subroutines to continue!{Colors.RESET}")
-    print(f"{Colors.BRIGHT_YELLOW}Use your icebreaker programs to break through.{Colors.RESET}\n")
+    out.append("")
+    out.append(f"{Colors.BRIGHT_WHITE}You must break the ICE subroutines to continue!{Colors.RESET}")
+    out.append(f"{Colors.BRIGHT_YELLOW}Use your icebreaker programs to break through.{Colors.RESET}")
+    out.append("")
 
-def display_run_success(server_name):
+@_buffered
+def display_run_success(server_name, *, out):
     """Display successful run animation"""
-    print(f"\n{Colors.BRIGHT_GREEN}{Colors.BOLD}!!! RUN SUCCESSFUL !!!{Colors.RESET}")
-    print(f"{Colors.BRIGHT_BLACK}{'=' * 80}{Colors.RESET}\n")
+    out.append("")
+    out.append(f"{Colors.BRIGHT_GREEN}{Colors.BOLD}!!! RUN SUCCESSFUL !!!{Colors.RESET}")
+    out.append(f"{Colors.BRIGHT_BLACK}{'=' * 80}{Colors.RESET}")
+    out.append("")
     
     # Display run ASCII art
     for line in GAME_UI_ASCII["run"]:
-        print(f"{Colors.BRIGHT_GREEN}{line}{Colors.RESET}")
+        out.append(f"{Colors.BRIGHT_GREEN}{line}{Colors.RESET}")
     
-    print(f"\n{Colors.BRIGHT_WHITE}You have successfully accessed {server_name}!{Colors.RESET}")
-    print(f"{Colors.BRIGHT_YELLOW}You may now access cards in this server.{Colors.RESET}\n")
+    out.append("")
+    out.append(f"{Colors.BRIGHT_WHITE}You have successfully accessed {server_name}!{Colors.RESET}")
+    out.append(f"{Colors.BRIGHT_YELLOW}You may now access cards in this server.{Colors.RESET}")
+    out.append("")
 
-def display_hand(hand_cards):
+@_buffered
+def display_hand(hand_cards, *, out):
     """Display cards in hand"""
-    print(f"\n{Colors.BRIGHT_WHITE}{Colors.BOLD}YOUR HAND:{Colors.RESET}")
-    print(f"{Colors.BRIGHT_BLACK}{'=' * 80}{Colors.RESET}\n")
+    out.append("")
+    out.append(f"{Colors.BRIGHT_WHITE}{Colors.BOLD}YOUR HAND:{Colors.RESET}")
+    out.append(f"{Colors.BRIGHT_BLACK}{'=' * 80}{Colors.RESET}")
+    out.append("")
     
     hand_display = [display_mini_card(card) for card in hand_cards]
-    print("\n".join(merge_horizontally(hand_display)))
-    print()
+    _add_block(out, merge_horizontally(hand_display))
+    out.append("")
 
 def display_board(options=None):
     """Display the full game board"""
     if not options:
         options = {}
     
-    clear_screen()
+    # The whole frame is collected here and written in one go at the end
+    out = []
     
     # Display logo
-    display_logo()
+    display_logo(out=out)
     
     # Display runner status
     display_status_bar(
         credits=options.get('credits', 5),
         memory=options.get('memory', [3, 4]),
-        clicks=options.get('clicks', 2)
+        clicks=options.get('clicks', 2),
+        out=out
     )
     
     # Set up current run if specified
@@ -375,38 +528,41 @@ def display_board(options=None):
         }
     
     # Display Corp servers
-    display_servers(server_data, current_run)
+    display_servers(server_data, current_run, out=out)
     
     # Display Runner's area
     default_installed = [
-        next(card for card in sample_cards if card["name"] == "Icebreaker.exe"),
-        next(card for card in sample_cards if card["name"] == "Neural Matrix"),
-        next(card for card in sample_cards if card["name"] == "Quantum Protocol"),
-        next(card for card in sample_cards if card["name"] == "Crypto Cache"),
+        _CARDS_BY_NAME["Icebreaker.exe"],
+        _CARDS_BY_NAME["Neural Matrix"],
+        _CARDS_BY_NAME["Quantum Protocol"],
+        _CARDS_BY_NAME["Crypto Cache"],
     ]
     
     runner_installed = options.get('installed_cards', default_installed)
-    display_runner_area(runner_installed)
+    display_runner_area(runner_installed, out=out)
     
     # Display hand cards
     default_hand = [
-        next(card for card in sample_cards if card["name"] == "Run Exploit"),
-        next(card for card in sample_cards if card["name"] == "Memory Chip"),
-        next(card for card in sample_cards if card["name"] == "Net Shield"),
+        _CARDS_BY_NAME["Run Exploit"],
+        _CARDS_BY_NAME["Memory Chip"],
+        _CARDS_BY_NAME["Net Shield"],
     ]
     hand_cards = options.get('hand_cards', default_hand)
-    display_hand(hand_cards)
+    display_hand(hand_cards, out=out)
     
     # Display ice encounter if in a run
     if options.get('ice_encounter') and current_run:
         ice_index = current_run['ice_index']
         server = current_run['server']
         if ice_index < len(server_data[server]['ice']):
-            display_ice_encounter(server_data[server]['ice'][ice_index])
+            display_ice_encounter(server_data[server]['ice'][ice_index], out=out)
     
     # Display run success if specified
     if options.get('run_success'):
-        display_run_success(options.get('run_server', 'Server'))
+        display_run_success(options.get('run_server', 'Server'), out=out)
+    
+    clear_screen()
+    write_frame(out)
 
 def parse_arguments():
     """Parse command-line arguments"""
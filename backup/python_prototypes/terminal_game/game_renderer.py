@@ -6,6 +6,11 @@ Terminal Renderer - Handles all text output for the terminal game
 import os
 import sys
 import shutil
+import functools
+import textwrap
+import time
+from collections import namedtuple
+from types import SimpleNamespace
 
 # ANSI color codes for terminal colors
 class Colors:
@@ -37,218 +42,386 @@ class Colors:
     BG_CYAN = "\033[46m"
     BG_WHITE = "\033[47m"
 
+Style = namedtuple("Style", ["color", "icon", "box_color"])
+
+# Display style per lowercased card type
+_TYPE_STYLE = {
+    "program": Style(Colors.BRIGHT_CYAN, "⟨⟩", Colors.BRIGHT_CYAN),
+    "icebreaker": Style(Colors.BRIGHT_BLUE, "⚒", Colors.BRIGHT_BLUE),
+    "hardware": Style(Colors.BRIGHT_YELLOW, "⚙", Colors.BRIGHT_YELLOW),
+    "resource": Style(Colors.BRIGHT_GREEN, "$", Colors.BRIGHT_GREEN),
+    "event": Style(Colors.BRIGHT_MAGENTA, "⚡", Colors.BRIGHT_MAGENTA),
+    "virus": Style(Colors.BRIGHT_RED, "⌘", Colors.BRIGHT_RED),
+    "ice": Style(Colors.BRIGHT_RED, "■", Colors.BRIGHT_RED),
+    "operation": Style(Colors.BRIGHT_BLUE, "▶", Colors.BRIGHT_BLUE),
+    "asset": Style(Colors.BRIGHT_YELLOW, "♦", Colors.BRIGHT_YELLOW),
+    "upgrade": Style(Colors.BRIGHT_GREEN, "▲", Colors.BRIGHT_GREEN),
+    "agenda": Style(Colors.BRIGHT_MAGENTA, "★", Colors.BRIGHT_MAGENTA),
+}
+_DEFAULT_STYLE = Style(Colors.RESET, "◆", Colors.BRIGHT_BLACK)
+
+# Raw ASCII art, shared by all renderers
+_ASCII_RAW = {
+    "logo": [
+        r"  _   _                   ____                 _                           ",
+        r" | \ | | ___  ___  _ __  |  _ \  ___  _ __ ___(_)_ __   __ _ _ __   ___ ___",
+        r" |  \| |/ _ \/ _ \| '_ \ | | | |/ _ \| '_ \_  / | '_ \ / _` | '_ \ / __/ _ \\",
+        r" | |\  |  __/ (_) | | | || |_| | (_) | | | / /| | | | | (_| | | | | (_|  __/",
+        r" |_| \_|\___|\___/|_| |_||____/ \___/|_| |/_/ |_|_| |_|\__,_|_| |_|\___\___|",
+        r"                                                                            "
+    ],
+    "runner": [
+        r"  _____                            ",
+        r" |  __ \                           ",
+        r" | |__) |_   _ _ __  _ __   ___ _ __",
+        r" |  _  /| | | | '_ \| '_ \ / _ \ '__|",
+        r" | | \ \| |_| | | | | | | |  __/ |   ",
+        r" |_|  \_\\__,_|_| |_|_| |_|\___|_|   ",
+        r"                                    "
+    ],
+    "corp": [
+        r"   _____                                    _   _             ",
+        r"  / ____|                                  | | (_)            ",
+        r" | |     ___  _ __ _ __   ___  _ __ __ _| |_ _  ___  _ __  ",
+        r" | |    / _ \| '__| '_ \ / _ \| '__/ _` | __| |/ _ \| '_ \ ",
+        r" | |___| (_) | |  | |_) | (_) | | | (_| | |_| | (_) | | | |",
+        r"  \_____\___/|_|  | .__/ \___/|_|  \__,_|\__|_|\___/|_| |_|",
+        r"                  | |                                       ",
+        r"                  |_|                                       "
+    ],
+    "run": [
+        r" _______ _______ _______ _______ _______ _______ _______ ",
+        r" |\     /|\     /|\     /|\     /|\     /|\     /|\     /|",
+        r" | +---+ | +---+ | +---+ | +---+ | +---+ | +---+ | +---+ |",
+        r" | |   | | |   | | |   | | |   | | |   | | |   | | |   | |",
+        r" | |R  | | |U  | | |N  | | |N  | | |I  | | |N  | | |G  | |",
+        r" | +---+ | +---+ | +---+ | +---+ | +---+ | +---+ | +---+ |",
+        r" |/_____\|/_____\|/_____\|/_____\|/_____\|/_____\|/_____\|",
+        r"                                                          "
+    ],
+    "ice": [
+        r" +-----------------+",
+        r" |    FIREWALL     |",
+        r" +-----------------+",
+        r" | [====||====]    |",
+        r" | [====||====]    |",
+        r" | [====||====]    |",
+        r" +-----------------+"
+    ],
+    # Card type ASCII art
+    "program": [
+        r"    _____",
+        r"   /    /|",
+        r"  /____/ |",
+        r" |    |  |",
+        r" |____|/   "
+    ],
+    "icebreaker": [
+        r"   /|  /|",
+        r"  /_|_/ |",
+        r" |     /|",
+        r" |__/|/ |",
+        r" |  ||  |",
+        r" |__|/   "
+    ],
+    "hardware": [
+        r"  _______",
+        r" /       \\",
+        r"|  o   o  |",
+        r"|    |    |",
+        r"|___|___|_|"
+    ],
+    "resource": [
+        r"    $$$    ",
+        r"   $   $   ",
+        r"   $   $   ",
+        r"   $   $   ",
+        r"    $$$    "
+    ],
+    "event": [
+        r"    /\\    ",
+        r"   /  \\   ",
+        r"  /    \\  ",
+        r" +------+ ",
+        r" |      | "
+    ],
+    "virus": [
+        r"    ()    ",
+        r"   /\\/\\   ",
+        r"  <(  )>  ",
+        r"   \\\\//   ",
+        r"    \\/    "
+    ],
+    "operation": [
+        r"   __/\\__   ",
+        r"  /      \\  ",
+        r" |   >>   | ",
+        r"  \\______/  ",
+        r"    |  |    "
+    ],
+    "asset": [
+        r"    _____    ",
+        r"   |     |   ",
+        r"   |  █  |   ",
+        r"   |_____|   ",
+        r"   /  |  \\   "
+    ],
+    "upgrade": [
+        r"     /\\     ",
+        r"    /||\\    ",
+        r"   /||||\\   ",
+        r"  /||||||\\  ",
+        r" /_|_||_|_\\ "
+    ],
+    "agenda": [
+        r"   _   _   ",
+        r"  / \\ / \\  ",
+        r" |  ■ ■  | ",
+        r"  \\_/ \\_/  ",
+        r"    | |    "
+    ],
+    # Server types
+    "rd_server": [
+        r"╔═══════════════════╗",
+        r"║ R&D SERVER ACCESS ║",
+        r"╠═══════════════════╣",
+        r"║ ┌─────┐ ┌─────┐   ║",
+        r"║ │DATA │ │DATA │   ║",
+        r"║ │FILES│ │FILES│   ║",
+        r"║ └─────┘ └─────┘   ║",
+        r"║ ┌─────┐           ║",
+        r"║ │DATA │           ║",
+        r"║ │FILES│           ║",
+        r"║ └─────┘           ║",
+        r"╚═══════════════════╝"
+    ],
+    "hq_server": [
+        r"╔═══════════════════╗",
+        r"║  HQ SERVER ACCESS ║",
+        r"╠═══════════════════╣",
+        r"║      ┌─────┐      ║",
+        r"║     /│CORP │\     ║",
+        r"║    / │ HQ  │ \    ║",
+        r"║   /  └─────┘  \   ║",
+        r"║  /     ___     \  ║",
+        r"║ │     /   \     │ ║",
+        r"║ │    │     │    │ ║",
+        r"║ └────╲___/─────┘ ║",
+        r"╚═══════════════════╝"
+    ],
+    "archives_server": [
+        r"╔═══════════════════╗",
+        r"║ ARCHIVES ACCESS   ║",
+        r"╠═══════════════════╣",
+        r"║    ┌─────────┐    ║",
+        r"║   /│ARCHIVES │\   ║",
+        r"║  / └─────────┘ \  ║",
+        r"║ │  ┌┐ ┌┐ ┌┐ ┌┐  │ ║",
+        r"║ │  └┘ └┘ └┘ └┘  │ ║",
+        r"║ │  ┌┐ ┌┐ ┌┐ ┌┐  │ ║",
+        r"║ │  └┘ └┘ └┘ └┘  │ ║",
+        r"║ └───────────────┘ ║",
+        r"╚═══════════════════╝"
+    ],
+    "remote_server": [
+        r"╔═══════════════════╗",
+        r"║  REMOTE{} ACCESS   ║",
+        r"╠═══════════════════╣",
+        r"║       ╱───╲       ║",
+        r"║      │     │      ║",
+        r"║     /│     │\     ║",
+        r"║    / │     │ \    ║",
+        r"║   │  │     │  │   ║",
+        r"║   │  │     │  │   ║",
+        r"║   \   ─────   /   ║",
+        r"║    ╲_________╱    ║",
+        r"╚═══════════════════╝"
+    ]
+}
+
+# Cyan-colored blob of every stock art entry, rendered once at import and
+# shared by all renderers
+_ASCII_CYAN_BLOBS = {
+    name: "".join(f"{Colors.BRIGHT_CYAN}{line}{Colors.RESET}\n" for line in lines)
+    for name, lines in _ASCII_RAW.items()
+}
+
+# Welcome banner (with its leading blank line), fully rendered once at import
+_WELCOME_BLOB = "\n" + "\n".join([
+    f"{Colors.BRIGHT_CYAN}================================{Colors.RESET}",
+    f"{Colors.BRIGHT_CYAN}    NEON DOMINANCE TERMINAL{Colors.RESET}",
+    f"{Colors.BRIGHT_CYAN}================================{Colors.RESET}",
+    f"{Colors.BRIGHT_GREEN}Neural Interface Active...{Colors.RESET}",
+    f"{Colors.BRIGHT_YELLOW}Establishing secure connection...{Colors.RESET}",
+    f"{Colors.BRIGHT_CYAN}Connection established.{Colors.RESET}",
+    f"{Colors.BRIGHT_MAGENTA}Welcome, runner. Jack in to begin.{Colors.RESET}",
+    f"{Colors.BRIGHT_CYAN}================================{Colors.RESET}",
+    ""
+]) + "\n"
+
+# Run progress track segments, repeated once per ICE
+_RUN_TRACK_RUNNER = f"{Colors.BRIGHT_MAGENTA}[RUNNER]"
+_RUN_TRACK_PASSED = f"{Colors.BRIGHT_BLACK}==={Colors.RESET}{Colors.BRIGHT_GREEN}[X]{Colors.RESET}"
+_RUN_TRACK_CURRENT = f"{Colors.BRIGHT_BLACK}==={Colors.RESET}{Colors.BRIGHT_RED}[!]{Colors.RESET}"
+_RUN_TRACK_UPCOMING = f"{Colors.BRIGHT_BLACK}===[ ]{Colors.RESET}"
+_RUN_TRACK_LEGEND = (
+    f"\n{Colors.BRIGHT_GREEN}[X]{Colors.RESET} = Passed ICE   "
+    f"{Colors.BRIGHT_RED}[!]{Colors.RESET} = Current ICE   "
+    f"{Colors.BRIGHT_BLACK}[ ]{Colors.RESET} = Upcoming ICE\n"
+)
+
+# Erase the display and home the cursor without spawning clear/cls
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+if os.name == 'nt':
+    # An empty shell call switches the Windows 10+ console into VT mode so
+    # the escape sequences above are honoured
+    os.system('')
+
+# Preallocated runs of the fill characters used for padding and rules;
+# _fill slices them instead of building a new repeated string every time
+_FILL_POOL = {char: char * 256 for char in " =-─═"}
+
+def _fill(char, count):
+    """Return char repeated count times (empty for count <= 0)"""
+    if count <= 0:
+        return ""
+    run = _FILL_POOL.get(char)
+    if run is None or len(run) < count:
+        run = _FILL_POOL[char] = char * max(256, count)
+    return run[:count]
+
+def _get_terminal_size():
+    """Query the terminal size with a single ioctl, falling back to shutil when stdout is not a tty"""
+    try:
+        return os.get_terminal_size(sys.stdout.fileno())
+    except (AttributeError, ValueError, OSError):
+        return shutil.get_terminal_size()
+
+@functools.lru_cache(maxsize=None)
+def _type_key(card_type):
+    """Lowercased card type, computed once per distinct type string"""
+    return card_type.lower()
+
+@functools.lru_cache(maxsize=512)
+def _format_card_cached(name, card_type, cost, mu, index):
+    """Format a card for display; cached since hands are re-rendered unchanged"""
+    style = _TYPE_STYLE.get(_type_key(card_type), _DEFAULT_STYLE)
+    
+    # Format the card info
+    prefix = f"[{index}] " if index is not None else ""
+    return (
+        f"{prefix}{style.color}{style.icon} {Colors.BOLD}{name}{Colors.RESET} - "
+        f"{style.color}{card_type}{Colors.RESET} - "
+        f"{cost}c {mu}mu"
+    )
+
+@functools.lru_cache(maxsize=4)
+def _command_help_text(command_items):
+    """Render the command help block for (command, description) pairs, in order"""
+    lines = [
+        f"{Colors.BOLD}TERMINAL COMMANDS:{Colors.RESET}",
+        f"{Colors.BRIGHT_BLACK}================={Colors.RESET}"
+    ]
+    
+    # Calculate the longest command for padding
+    longest_cmd = max(len(cmd) for cmd, _ in command_items)
+    
+    # Display commands in a columnar format
+    for cmd, desc in command_items:
+        padding = _fill(' ', longest_cmd - len(cmd) + 3)
+        lines.append(f"{Colors.BRIGHT_GREEN}{cmd}{Colors.RESET}{padding}- {desc}")
+    
+    lines.append(f"\nFor detailed information on a command, type '{Colors.BRIGHT_YELLOW}help <command>{Colors.RESET}' or '{Colors.BRIGHT_YELLOW}man <command>{Colors.RESET}'.")
+    lines.append("")
+    return "\n".join(lines) + "\n"
+
 class TerminalRenderer:
+    # False for renderers that discard output, so callers can skip building it
+    enabled = True
+    
     def __init__(self):
         self.status_line = ""
         self.prompt_text = "> "
-        self.terminal_width = shutil.get_terminal_size().columns
-        self.terminal_height = shutil.get_terminal_size().lines
+        terminal_size = _get_terminal_size()
+        self.terminal_width = terminal_size.columns
+        self.terminal_height = terminal_size.lines
+        self._size_checked_at = time.monotonic()
         self.header_text = "NEON DOMINANCE TERMINAL"
-        self.ascii_art = {
-            "logo": [
-                r"  _   _                   ____                 _                           ",
-                r" | \ | | ___  ___  _ __  |  _ \  ___  _ __ ___(_)_ __   __ _ _ __   ___ ___",
-                r" |  \| |/ _ \/ _ \| '_ \ | | | |/ _ \| '_ \_  / | '_ \ / _` | '_ \ / __/ _ \\",
-                r" | |\  |  __/ (_) | | | || |_| | (_) | | | / /| | | | | (_| | | | | (_|  __/",
-                r" |_| \_|\___|\___/|_| |_||____/ \___/|_| |/_/ |_|_| |_|\__,_|_| |_|\___\___|",
-                r"                                                                            "
-            ],
-            "runner": [
-                r"  _____                            ",
-                r" |  __ \                           ",
-                r" | |__) |_   _ _ __  _ __   ___ _ __",
-                r" |  _  /| | | | '_ \| '_ \ / _ \ '__|",
-                r" | | \ \| |_| | | | | | | |  __/ |   ",
-                r" |_|  \_\\__,_|_| |_|_| |_|\___|_|   ",
-                r"                                    "
-            ],
-            "corp": [
-                r"   _____                                    _   _             ",
-                r"  / ____|                                  | | (_)            ",
-                r" | |     ___  _ __ _ __   ___  _ __ __ _| |_ _  ___  _ __  ",
-                r" | |    / _ \| '__| '_ \ / _ \| '__/ _` | __| |/ _ \| '_ \ ",
-                r" | |___| (_) | |  | |_) | (_) | | | (_| | |_| | (_) | | | |",
-                r"  \_____\___/|_|  | .__/ \___/|_|  \__,_|\__|_|\___/|_| |_|",
-                r"                  | |                                       ",
-                r"                  |_|                                       "
-            ],
-            "run": [
-                r" _______ _______ _______ _______ _______ _______ _______ ",
-                r" |\     /|\     /|\     /|\     /|\     /|\     /|\     /|",
-                r" | +---+ | +---+ | +---+ | +---+ | +---+ | +---+ | +---+ |",
-                r" | |   | | |   | | |   | | |   | | |   | | |   | | |   | |",
-                r" | |R  | | |U  | | |N  | | |N  | | |I  | | |N  | | |G  | |",
-                r" | +---+ | +---+ | +---+ | +---+ | +---+ | +---+ | +---+ |",
-                r" |/_____\|/_____\|/_____\|/_____\|/_____\|/_____\|/_____\|",
-                r"                                                          "
-            ],
-            "ice": [
-                r" +-----------------+",
-                r" |    FIREWALL     |",
-                r" +-----------------+",
-                r" | [====||====]    |",
-                r" | [====||====]    |",
-                r" | [====||====]    |",
-                r" +-----------------+"
-            ],
-            # Card type ASCII art
-            "program": [
-                r"    _____",
-                r"   /    /|",
-                r"  /____/ |",
-                r" |    |  |",
-                r" |____|/   "
-            ],
-            "icebreaker": [
-                r"   /|  /|",
-                r"  /_|_/ |",
-                r" |     /|",
-                r" |__/|/ |",
-                r" |  ||  |",
-                r" |__|/   "
-            ],
-            "hardware": [
-                r"  _______",
-                r" /       \\",
-                r"|  o   o  |",
-                r"|    |    |",
-                r"|___|___|_|"
-            ],
-            "resource": [
-                r"    $$$    ",
-                r"   $   $   ",
-                r"   $   $   ",
-                r"   $   $   ",
-                r"    $$$    "
-            ],
-            "event": [
-                r"    /\\    ",
-                r"   /  \\   ",
-                r"  /    \\  ",
-                r" +------+ ",
-                r" |      | "
-            ],
-            "virus": [
-                r"    ()    ",
-                r"   /\\/\\   ",
-                r"  <(  )>  ",
-                r"   \\\\//   ",
-                r"    \\/    "
-            ],
-            "operation": [
-                r"   __/\\__   ",
-                r"  /      \\  ",
-                r" |   >>   | ",
-                r"  \\______/  ",
-                r"    |  |    "
-            ],
-            "asset": [
-                r"    _____    ",
-                r"   |     |   ",
-                r"   |  █  |   ",
-                r"   |_____|   ",
-                r"   /  |  \\   "
-            ],
-            "upgrade": [
-                r"     /\\     ",
-                r"    /||\\    ",
-                r"   /||||\\   ",
-                r"  /||||||\\  ",
-                r" /_|_||_|_\\ "
-            ],
-            "agenda": [
-                r"   _   _   ",
-                r"  / \\ / \\  ",
-                r" |  ■ ■  | ",
-                r"  \\_/ \\_/  ",
-                r"    | |    "
-            ],
-            # Server types
-            "rd_server": [
-                r"╔═══════════════════╗",
-                r"║ R&D SERVER ACCESS ║",
-                r"╠═══════════════════╣",
-                r"║ ┌─────┐ ┌─────┐   ║",
-                r"║ │DATA │ │DATA │   ║",
-                r"║ │FILES│ │FILES│   ║",
-                r"║ └─────┘ └─────┘   ║",
-                r"║ ┌─────┐           ║",
-                r"║ │DATA │           ║",
-                r"║ │FILES│           ║",
-                r"║ └─────┘           ║",
-                r"╚═══════════════════╝"
-            ],
-            "hq_server": [
-                r"╔═══════════════════╗",
-                r"║  HQ SERVER ACCESS ║",
-                r"╠═══════════════════╣",
-                r"║      ┌─────┐      ║",
-                r"║     /│CORP │\     ║",
-                r"║    / │ HQ  │ \    ║",
-                r"║   /  └─────┘  \   ║",
-                r"║  /     ___     \  ║",
-                r"║ │     /   \     │ ║",
-                r"║ │    │     │    │ ║",
-                r"║ └────╲___/─────┘ ║",
-                r"╚═══════════════════╝"
-            ],
-            "archives_server": [
-                r"╔═══════════════════╗",
-                r"║ ARCHIVES ACCESS   ║",
-                r"╠═══════════════════╣",
-                r"║    ┌─────────┐    ║",
-                r"║   /│ARCHIVES │\   ║",
-                r"║  / └─────────┘ \  ║",
-                r"║ │  ┌┐ ┌┐ ┌┐ ┌┐  │ ║",
-                r"║ │  └┘ └┘ └┘ └┘  │ ║",
-                r"║ │  ┌┐ ┌┐ ┌┐ ┌┐  │ ║",
-                r"║ │  └┘ └┘ └┘ └┘  │ ║",
-                r"║ └───────────────┘ ║",
-                r"╚═══════════════════╝"
-            ],
-            "remote_server": [
-                r"╔═══════════════════╗",
-                r"║  REMOTE{} ACCESS   ║",
-                r"╠═══════════════════╣",
-                r"║       ╱───╲       ║",
-                r"║      │     │      ║",
-                r"║     /│     │\     ║",
-                r"║    / │     │ \    ║",
-                r"║   │  │     │  │   ║",
-                r"║   │  │     │  │   ║",
-                r"║   \   ─────   /   ║",
-                r"║    ╲_________╱    ║",
-                r"╚═══════════════════╝"
-            ]
-        }
+        self.ascii_art = _ASCII_RAW
+        # Colored art blobs kept as attributes; entries missing from the stock
+        # set are rendered on first use
+        self._art_ns = SimpleNamespace(**_ASCII_CYAN_BLOBS)
+        # Pending output, written in one go by flush() when the prompt is shown
+        self._out_buf = []
+        # Server art per run target, see _server_art_blob
+        self._server_art_cache = {}
+    
+    def _write(self, text):
+        """Queue text for the next flush()"""
+        self._out_buf.append(text)
+    
+    def flush(self):
+        """Write all queued output to the terminal with a single write and flush"""
+        stdout = sys.stdout
+        stdout.flush()
+        if self._out_buf:
+            text = "".join(self._out_buf)
+            self._out_buf.clear()
+            raw = getattr(stdout, "buffer", None)
+            if raw is not None:
+                # Encode the whole batch once and bypass the text layer
+                raw.write(text.encode(stdout.encoding or "utf-8", stdout.errors or "strict"))
+                raw.flush()
+            else:
+                stdout.write(text)
+                stdout.flush()
+    
+    def _width(self):
+        """Return the terminal width, re-reading it at most once per second"""
+        now = time.monotonic()
+        if now - self._size_checked_at > 1.0:
+            terminal_size = _get_terminal_size()
+            self.terminal_width = terminal_size.columns
+            self.terminal_height = terminal_size.lines
+            self._size_checked_at = now
+        return self.terminal_width
     
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self._write(_CLEAR_SCREEN)
+        self.flush()
     
     def output(self, text):
         """Output regular text to the terminal"""
-        print(text)
+        self._write(f"{text}\n")
     
     def output_error(self, text):
         """Output error text to the terminal (in red)"""
-        print(f"{Colors.BRIGHT_RED}ERROR: {text}{Colors.RESET}")
+        self._write(f"{Colors.BRIGHT_RED}ERROR: {text}{Colors.RESET}\n")
     
     def output_warning(self, text):
         """Output warning text to the terminal (in yellow)"""
-        print(f"{Colors.BRIGHT_YELLOW}WARNING: {text}{Colors.RESET}")
+        self._write(f"{Colors.BRIGHT_YELLOW}WARNING: {text}{Colors.RESET}\n")
     
     def output_success(self, text):
         """Output success text to the terminal (in green)"""
-        print(f"{Colors.BRIGHT_GREEN}{text}{Colors.RESET}")
+        self._write(f"{Colors.BRIGHT_GREEN}{text}{Colors.RESET}\n")
     
+    def _ascii_art_blob(self, art_name):
+        """Return the colored art as one newline-terminated string, or None if unknown"""
+        blob = getattr(self._art_ns, art_name, None)
+        if blob is None:
+            lines = self.ascii_art.get(art_name)
+            if lines is None:
+                return None
+            blob = "".join(f"{Colors.BRIGHT_CYAN}{line}{Colors.RESET}\n" for line in lines)
+            setattr(self._art_ns, art_name, blob)
+        return blob
+
     def output_ascii_art(self, art_name):
         """Display ASCII art from the collection"""
-        if art_name in self.ascii_art:
-            for line in self.ascii_art[art_name]:
-                print(f"{Colors.BRIGHT_CYAN}{line}{Colors.RESET}")
-        else:
-            print(f"ASCII art '{art_name}' not found")
+        blob = self._ascii_art_blob(art_name)
+        self._write(blob or f"ASCII art '{art_name}' not found\n")
     
     def update_status(self, status_text):
         """Update the status line at the bottom of the terminal"""
@@ -256,118 +429,45 @@ class TerminalRenderer:
         
         # In a full implementation, we might use curses to keep this at the bottom
         # For now, we'll just print it
-        print(f"\n{Colors.BRIGHT_BLACK}{'-' * self.terminal_width}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_CYAN}{status_text}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_BLACK}{'-' * self.terminal_width}{Colors.RESET}")
+        width = self._width()
+        self._write(f"\n{Colors.BRIGHT_BLACK}{_fill('-', width)}{Colors.RESET}\n")
+        self._write(f"{Colors.BRIGHT_CYAN}{status_text}{Colors.RESET}\n")
+        self._write(f"{Colors.BRIGHT_BLACK}{_fill('-', width)}{Colors.RESET}\n")
     
     def display_prompt(self):
         """Display the command prompt"""
-        print(f"{Colors.BRIGHT_GREEN}{self.prompt_text}{Colors.RESET}", end="")
-        sys.stdout.flush()
+        self._write(f"{Colors.BRIGHT_GREEN}{self.prompt_text}{Colors.RESET}")
+        self.flush()
     
     def display_header(self):
         """Display the terminal header"""
+        width = self._width()
         header = f" {self.header_text} "
-        padding = (self.terminal_width - len(header)) // 2
-        header_line = "=" * padding + header + "=" * padding
+        padding = (width - len(header)) // 2
+        header_line = _fill('=', padding) + header + _fill('=', padding)
         
         # Adjust if the total length is off by one (due to integer division)
-        if len(header_line) < self.terminal_width:
+        if len(header_line) < width:
             header_line += "="
         
-        print(f"{Colors.BRIGHT_CYAN}{header_line}{Colors.RESET}")
+        self._write(f"{Colors.BRIGHT_CYAN}{header_line}{Colors.RESET}\n")
     
     def display_welcome(self):
         """Display an enhanced welcome message"""
         self.clear_screen()
         self.output_ascii_art("logo")
-        print()
-        welcome_text = [
-            f"{Colors.BRIGHT_CYAN}================================{Colors.RESET}",
-            f"{Colors.BRIGHT_CYAN}    NEON DOMINANCE TERMINAL{Colors.RESET}",
-            f"{Colors.BRIGHT_CYAN}================================{Colors.RESET}",
-            f"{Colors.BRIGHT_GREEN}Neural Interface Active...{Colors.RESET}",
-            f"{Colors.BRIGHT_YELLOW}Establishing secure connection...{Colors.RESET}",
-            f"{Colors.BRIGHT_CYAN}Connection established.{Colors.RESET}",
-            f"{Colors.BRIGHT_MAGENTA}Welcome, runner. Jack in to begin.{Colors.RESET}",
-            f"{Colors.BRIGHT_CYAN}================================{Colors.RESET}",
-            ""
-        ]
-        for line in welcome_text:
-            print(line)
+        self._write(_WELCOME_BLOB)
+        self.flush()
     
     def display_command_help(self, valid_commands):
         """Display available commands in a nicely formatted way"""
-        print(f"{Colors.BOLD}TERMINAL COMMANDS:{Colors.RESET}")
-        print(f"{Colors.BRIGHT_BLACK}================={Colors.RESET}")
-        
-        # Calculate the longest command for padding
-        longest_cmd = max(len(cmd) for cmd in valid_commands.keys())
-        
-        # Display commands in a columnar format
-        for cmd, desc in valid_commands.items():
-            padding = " " * (longest_cmd - len(cmd) + 3)
-            print(f"{Colors.BRIGHT_GREEN}{cmd}{Colors.RESET}{padding}- {desc}")
-        
-        print(f"\nFor detailed information on a command, type '{Colors.BRIGHT_YELLOW}help <command>{Colors.RESET}' or '{Colors.BRIGHT_YELLOW}man <command>{Colors.RESET}'.")
-        print()
+        self._write(_command_help_text(tuple(valid_commands.items())))
     
     def format_card(self, card, index=None):
         """Format a card for display"""
-        card_type = card.get('type', 'Unknown')
-        
-        # Change color based on card type
-        type_color = Colors.RESET
-        icon = "◆"  # Default icon
-        
-        if card_type.lower() == "program":
-            type_color = Colors.BRIGHT_CYAN
-            icon = "⟨⟩"
-        elif card_type.lower() == "icebreaker":
-            type_color = Colors.BRIGHT_BLUE
-            icon = "⚒"
-        elif card_type.lower() == "hardware":
-            type_color = Colors.BRIGHT_YELLOW
-            icon = "⚙"
-        elif card_type.lower() == "resource":
-            type_color = Colors.BRIGHT_GREEN
-            icon = "$"
-        elif card_type.lower() == "event":
-            type_color = Colors.BRIGHT_MAGENTA
-            icon = "⚡"
-        elif card_type.lower() == "virus":
-            type_color = Colors.BRIGHT_RED
-            icon = "⌘"
-        elif card_type.lower() == "ice":
-            type_color = Colors.BRIGHT_RED
-            icon = "■"
-        elif card_type.lower() == "operation":
-            type_color = Colors.BRIGHT_BLUE
-            icon = "▶"
-        elif card_type.lower() == "asset":
-            type_color = Colors.BRIGHT_YELLOW
-            icon = "♦" 
-        elif card_type.lower() == "upgrade":
-            type_color = Colors.BRIGHT_GREEN
-            icon = "▲"
-        elif card_type.lower() == "agenda":
-            type_color = Colors.BRIGHT_MAGENTA
-            icon = "★"
-        
-        # Format the card info
-        if index is not None:
-            return (
-                f"[{index}] {type_color}{icon} {Colors.BOLD}{card.get('name', 'Unknown')}{Colors.RESET} - "
-                f"{type_color}{card_type}{Colors.RESET} - "
-                f"{card.get('cost', 0)}c {card.get('mu', 0)}mu"
-            )
-        else:
-            return (
-                f"{type_color}{icon} {Colors.BOLD}{card.get('name', 'Unknown')}{Colors.RESET} - "
-                f"{type_color}{card_type}{Colors.RESET} - "
-                f"{card.get('cost', 0)}c {card.get('mu', 0)}mu"
-            )
-    
+        return _format_card_cached(card.get('name', 'Unknown'), card.get('type', 'Unknown'),
+                                   card.get('cost', 0), card.get('mu', 0), index)
+
     def display_card_details(self, card):
         """Display detailed information about a card in a box format"""
         card_type = card.get('type', 'Unknown')
@@ -377,113 +477,82 @@ class TerminalRenderer:
         description = card.get('description', 'No description')
         
         # Visual formatting
-        width = min(60, self.terminal_width - 4)  # Limit box width
+        width = min(60, self._width() - 4)  # Limit box width
         
         # Type-specific colors
-        type_color = Colors.RESET
-        box_color = Colors.BRIGHT_BLACK
-        if card_type.lower() == "program":
-            type_color = Colors.BRIGHT_CYAN
-            box_color = Colors.BRIGHT_CYAN
-        elif card_type.lower() == "hardware":
-            type_color = Colors.BRIGHT_YELLOW
-            box_color = Colors.BRIGHT_YELLOW
-        elif card_type.lower() == "resource":
-            type_color = Colors.BRIGHT_GREEN
-            box_color = Colors.BRIGHT_GREEN
-        elif card_type.lower() == "event":
-            type_color = Colors.BRIGHT_MAGENTA
-            box_color = Colors.BRIGHT_MAGENTA
-        elif card_type.lower() == "virus":
-            type_color = Colors.BRIGHT_RED
-            box_color = Colors.BRIGHT_RED
-        elif card_type.lower() == "icebreaker":
-            type_color = Colors.BRIGHT_BLUE
-            box_color = Colors.BRIGHT_BLUE
-        elif card_type.lower() == "ice":
-            type_color = Colors.BRIGHT_RED
-            box_color = Colors.BRIGHT_RED
-        elif card_type.lower() == "operation":
-            type_color = Colors.BRIGHT_BLUE
-            box_color = Colors.BRIGHT_BLUE
-        elif card_type.lower() == "asset":
-            type_color = Colors.BRIGHT_YELLOW
-            box_color = Colors.BRIGHT_YELLOW
-        elif card_type.lower() == "upgrade":
-            type_color = Colors.BRIGHT_GREEN
-            box_color = Colors.BRIGHT_GREEN
-        elif card_type.lower() == "agenda":
-            type_color = Colors.BRIGHT_MAGENTA
-            box_color = Colors.BRIGHT_MAGENTA
+        art_key = _type_key(card_type)
+        type_color, _, box_color = _TYPE_STYLE.get(art_key, _DEFAULT_STYLE)
+        
+        lines = []
         
         # Create card box
-        print(f"{box_color}┌{'─' * (width - 2)}┐{Colors.RESET}")
+        lines.append(f"{box_color}┌{_fill('─', width - 2)}┐")
         
         # Card name
-        name_padding = (width - 2 - len(name)) // 2
-        print(f"{box_color}│{Colors.RESET}{' ' * name_padding}{Colors.BOLD}{name}{Colors.RESET}{' ' * (width - 2 - len(name) - name_padding)}{box_color}│{Colors.RESET}")
+        lines.append(f"│{Colors.RESET}{Colors.BOLD}{name.center(width - 2)}{Colors.RESET}{box_color}│")
         
         # Card type
-        print(f"{box_color}│{Colors.RESET} {type_color}{card_type}{Colors.RESET}{' ' * (width - 3 - len(card_type))}{box_color}│{Colors.RESET}")
+        lines.append(f"│ {type_color}{card_type.ljust(width - 3)}{box_color}│")
         
         # Cost and MU
         stats = f"Cost: {cost}   MU: {mu}"
-        print(f"{box_color}│{Colors.RESET} {stats}{' ' * (width - 3 - len(stats))}{box_color}│{Colors.RESET}")
+        lines.append(f"│{Colors.RESET} {stats.ljust(width - 3)}{box_color}│")
         
         # Card ASCII art (if available)
-        art_key = card_type.lower()
         if art_key in self.ascii_art:
-            print(f"{box_color}├{'─' * (width - 2)}┤{Colors.RESET}")
+            lines.append(f"├{_fill('─', width - 2)}┤")
             art_lines = self.ascii_art[art_key]
             for line in art_lines:
-                line_padding = (width - 2 - len(line)) // 2
-                print(f"{box_color}│{Colors.RESET}{' ' * line_padding}{type_color}{line}{Colors.RESET}{' ' * (width - 2 - len(line) - line_padding)}{box_color}│{Colors.RESET}")
+                lines.append(f"│{type_color}{line.center(width - 2)}{box_color}│")
         
         # Separator
-        print(f"{box_color}├{'─' * (width - 2)}┤{Colors.RESET}")
+        lines.append(f"├{_fill('─', width - 2)}┤")
         
         # Description - word wrap
-        words = description.split()
-        line = ""
-        for word in words:
-            if len(line) + len(word) + 1 <= width - 4:
-                line += word + " "
-            else:
-                print(f"{box_color}│{Colors.RESET} {line}{' ' * (width - 3 - len(line))}{box_color}│{Colors.RESET}")
-                line = word + " "
-        if line:
-            print(f"{box_color}│{Colors.RESET} {line}{' ' * (width - 3 - len(line))}{box_color}│{Colors.RESET}")
+        for line in textwrap.wrap(description, width=width - 4):
+            lines.append(f"│{Colors.RESET} {line.ljust(width - 3)}{box_color}│")
         
         # Ability details if available
         if 'ability' in card:
             ability_type = card['ability'].get('type', 'Unknown')
-            print(f"{box_color}├{'─' * (width - 2)}┤{Colors.RESET}")
-            print(f"{box_color}│{Colors.RESET} {Colors.BRIGHT_GREEN}Ability Type:{Colors.RESET} {ability_type}{' ' * (width - 15 - len(ability_type))}{box_color}│{Colors.RESET}")
+            lines.append(f"├{_fill('─', width - 2)}┤")
+            lines.append(f"│ {Colors.BRIGHT_GREEN}Ability Type:{Colors.RESET} {ability_type.ljust(width - 15)}{box_color}│")
             
             # Show relevant ability details based on type
             if ability_type == 'break_ice':
                 ice_types = ', '.join(card['ability'].get('ice_types', ['Unknown']))
                 max_strength = str(card['ability'].get('max_strength', 0))
-                print(f"{box_color}│{Colors.RESET} {Colors.BRIGHT_GREEN}Ice Types:{Colors.RESET} {ice_types}{' ' * (width - 12 - len(ice_types))}{box_color}│{Colors.RESET}")
-                print(f"{box_color}│{Colors.RESET} {Colors.BRIGHT_GREEN}Max Strength:{Colors.RESET} {max_strength}{' ' * (width - 15 - len(max_strength))}{box_color}│{Colors.RESET}")
+                lines.append(f"│ {Colors.BRIGHT_GREEN}Ice Types:{Colors.RESET} {ice_types.ljust(width - 12)}{box_color}│")
+                lines.append(f"│ {Colors.BRIGHT_GREEN}Max Strength:{Colors.RESET} {max_strength.ljust(width - 15)}{box_color}│")
             elif ability_type == 'permanent' or ability_type == 'trigger':
                 effect = card['ability'].get('effect', 'Unknown')
                 value = str(card['ability'].get('value', 0))
-                print(f"{box_color}│{Colors.RESET} {Colors.BRIGHT_GREEN}Effect:{Colors.RESET} {effect}{' ' * (width - 9 - len(effect))}{box_color}│{Colors.RESET}")
-                print(f"{box_color}│{Colors.RESET} {Colors.BRIGHT_GREEN}Value:{Colors.RESET} {value}{' ' * (width - 8 - len(value))}{box_color}│{Colors.RESET}")
+                lines.append(f"│ {Colors.BRIGHT_GREEN}Effect:{Colors.RESET} {effect.ljust(width - 9)}{box_color}│")
+                lines.append(f"│ {Colors.BRIGHT_GREEN}Value:{Colors.RESET} {value.ljust(width - 8)}{box_color}│")
         
         # Bottom of box
-        print(f"{box_color}└{'─' * (width - 2)}┘{Colors.RESET}")
+        lines.append(f"└{_fill('─', width - 2)}┘{Colors.RESET}")
+        
+        self._write("\n".join(lines) + "\n")
     
     def display_running_animation(self, target_server):
         """Display a visual representation of initiating a run"""
-        print(f"\n{Colors.BRIGHT_MAGENTA}INITIATING RUN ON {Colors.BOLD}{target_server}{Colors.RESET}{Colors.BRIGHT_MAGENTA}...{Colors.RESET}")
+        self._write(f"\n{Colors.BRIGHT_MAGENTA}INITIATING RUN ON {Colors.BOLD}{target_server}{Colors.RESET}{Colors.BRIGHT_MAGENTA}...{Colors.RESET}\n")
         
         # Show the run animation
         self.output_ascii_art("run")
         
+        self._write(self._server_art_blob(target_server))
+    
+    def _server_art_blob(self, target_server):
+        """Return the colored server art for a run target, rendered once per target"""
+        blob = self._server_art_cache.get(target_server)
+        if blob is not None:
+            return blob
+        
         # Normalize the server name to match the keys in the ascii_art dictionary
-        server_key = ""
+        server_art = None
+        server_key = None
         if target_server == "R&D":
             server_key = "rd_server"
             color = Colors.BRIGHT_CYAN
@@ -494,49 +563,37 @@ class TerminalRenderer:
             server_key = "archives_server"
             color = Colors.BRIGHT_GREEN
         elif target_server.startswith("REMOTE"):
-            # Get the remote server number
-            try:
-                server_num = target_server[6:]
-                # Create a copy of the template and format with server number
-                server_art = self.ascii_art["remote_server"].copy()
-                server_art[1] = server_art[1].format(server_num)
+            # Fill the server number into a copy of the template; without a
+            # usable template only the spacing is shown
+            template = self.ascii_art.get("remote_server")
+            if template and len(template) > 1:
+                server_art = list(template)
+                server_art[1] = server_art[1].format(target_server[6:])
                 color = Colors.BRIGHT_YELLOW
-                
-                # Print the server visualization
-                print()  # Add spacing
-                for line in server_art:
-                    print(f"{color}{line}{Colors.RESET}")
-                print()  # Add spacing after visualization
-                return
-            except:
-                # Fallback
-                server_key = None
-                color = Colors.RESET
-        else:
-            server_key = None
-            color = Colors.RESET
             
-        # Print the server visualization if server_key is valid
         if server_key and server_key in self.ascii_art:
             server_art = self.ascii_art[server_key]
-            print()  # Add spacing
-            for line in server_art:
-                print(f"{color}{line}{Colors.RESET}")
         
-        print()  # Add spacing after visualization
+        # Spacing before and after the visualization
+        if server_art is None:
+            blob = "\n"
+        else:
+            blob = "\n" + "".join(f"{color}{line}{Colors.RESET}\n" for line in server_art) + "\n"
+        self._server_art_cache[target_server] = blob
+        return blob
     
     def display_ice_encounter(self, ice_card):
         """Display a visual representation of encountering ICE"""
-        print(f"\n{Colors.BRIGHT_RED}ICE ENCOUNTERED:{Colors.RESET}")
+        self._write(f"\n{Colors.BRIGHT_RED}ICE ENCOUNTERED:{Colors.RESET}\n")
         self.display_mini_card(ice_card, f"{Colors.BRIGHT_RED}> You must deal with this ICE to continue{Colors.RESET}")
         if 'description' in ice_card:
-            print(f"{Colors.BRIGHT_RED}> {ice_card['description']}{Colors.RESET}")
-        print()
+            self._write(f"{Colors.BRIGHT_RED}> {ice_card['description']}{Colors.RESET}\n")
+        self._write("\n")
     
     def display_turn_start(self, turn_number, player_side):
         """Display a visually appealing turn start banner"""
-        print(f"\n{Colors.BRIGHT_BLACK}{'=' * 42}{Colors.RESET}")
-        print(f"{Colors.BOLD}Turn {turn_number} - {player_side.capitalize()}'s turn{Colors.RESET}")
+        self._write(f"\n{Colors.BRIGHT_BLACK}{'=' * 42}{Colors.RESET}\n")
+        self._write(f"{Colors.BOLD}Turn {turn_number} - {player_side.capitalize()}'s turn{Colors.RESET}\n")
         
         if player_side.lower() == "runner":
             self.output_ascii_art("runner")
@@ -545,19 +602,24 @@ class TerminalRenderer:
     
     def display_game_over(self, winner, message):
         """Display game over message with visual effects"""
-        print(f"\n{Colors.BG_BLUE}{Colors.BRIGHT_WHITE}{'=' * 60}{Colors.RESET}")
-        print(f"{Colors.BG_BLUE}{Colors.BRIGHT_WHITE}{'GAME OVER':^60}{Colors.RESET}")
-        print(f"{Colors.BG_BLUE}{Colors.BRIGHT_WHITE}{'=' * 60}{Colors.RESET}\n")
+        self._write(
+            f"\n{Colors.BG_BLUE}{Colors.BRIGHT_WHITE}{'=' * 60}{Colors.RESET}\n"
+            f"{Colors.BG_BLUE}{Colors.BRIGHT_WHITE}{'GAME OVER':^60}{Colors.RESET}\n"
+            f"{Colors.BG_BLUE}{Colors.BRIGHT_WHITE}{'=' * 60}{Colors.RESET}\n\n"
+        )
         
         if winner == "runner":
             self.output_ascii_art("runner")
-            print(f"\n{Colors.BRIGHT_CYAN}RUNNER WINS!{Colors.RESET}")
+            banner = f"{Colors.BRIGHT_CYAN}RUNNER WINS!{Colors.RESET}"
         else:
             self.output_ascii_art("corp")
-            print(f"\n{Colors.BRIGHT_RED}CORPORATION WINS!{Colors.RESET}")
+            banner = f"{Colors.BRIGHT_RED}CORPORATION WINS!{Colors.RESET}"
         
-        print(f"\n{Colors.BOLD}{message}{Colors.RESET}\n")
-        print(f"{Colors.BRIGHT_BLACK}{'=' * 60}{Colors.RESET}")
+        self._write(
+            f"\n{banner}\n"
+            f"\n{Colors.BOLD}{message}{Colors.RESET}\n\n"
+            f"{Colors.BRIGHT_BLACK}{'=' * 60}{Colors.RESET}\n"
+        )
 
     # Add a new method for displaying a mini card representation during play
     def display_mini_card(self, card, action_text=None):
@@ -566,32 +628,10 @@ class TerminalRenderer:
         name = card.get('name', 'Unknown')
         
         # Determine card color
-        type_color = Colors.RESET
-        if card_type.lower() == "program":
-            type_color = Colors.BRIGHT_CYAN
-        elif card_type.lower() == "hardware":
-            type_color = Colors.BRIGHT_YELLOW
-        elif card_type.lower() == "resource":
-            type_color = Colors.BRIGHT_GREEN
-        elif card_type.lower() == "event":
-            type_color = Colors.BRIGHT_MAGENTA
-        elif card_type.lower() == "virus":
-            type_color = Colors.BRIGHT_RED
-        elif card_type.lower() == "icebreaker":
-            type_color = Colors.BRIGHT_BLUE
-        elif card_type.lower() == "ice":
-            type_color = Colors.BRIGHT_RED
-        elif card_type.lower() == "operation":
-            type_color = Colors.BRIGHT_BLUE
-        elif card_type.lower() == "asset":
-            type_color = Colors.BRIGHT_YELLOW
-        elif card_type.lower() == "upgrade":
-            type_color = Colors.BRIGHT_GREEN
-        elif card_type.lower() == "agenda":
-            type_color = Colors.BRIGHT_MAGENTA
+        art_key = _type_key(card_type)
+        type_color = _TYPE_STYLE.get(art_key, _DEFAULT_STYLE).color
             
         # Get card art if available
-        art_key = card_type.lower()
         art_lines = []
         if art_key in self.ascii_art:
             art_lines = self.ascii_art[art_key]
@@ -599,72 +639,121 @@ class TerminalRenderer:
         # Calculate card width based on name length (minimum 20)
         card_width = max(20, len(name) + 4)
         
+        lines = []
+        
         # Top of card
-        print(f"{type_color}╔{'═' * card_width}╗{Colors.RESET}")
+        lines.append(f"{type_color}╔{_fill('═', card_width)}╗")
         
         # Card name
-        print(f"{type_color}║{Colors.BOLD} {name}{' ' * (card_width - len(name) - 1)}{Colors.RESET}{type_color}║{Colors.RESET}")
+        lines.append(f"║{Colors.BOLD} {name.ljust(card_width - 1)}{Colors.RESET}{type_color}║")
         
         # Card type
-        print(f"{type_color}║ {card_type}{' ' * (card_width - len(card_type) - 1)}║{Colors.RESET}")
+        lines.append(f"║ {card_type.ljust(card_width - 1)}║")
         
         # Display mini ASCII art if available
         if art_lines:
             # Use up to 3 lines of art to keep it compact
             art_sample = art_lines[:min(3, len(art_lines))]
             for line in art_sample:
-                padding = (card_width - len(line)) // 2
-                print(f"{type_color}║{' ' * padding}{line}{' ' * (card_width - len(line) - padding)}║{Colors.RESET}")
+                lines.append(f"║{line.center(card_width)}║")
         
         # Bottom of card
-        print(f"{type_color}╚{'═' * card_width}╝{Colors.RESET}")
+        lines.append(f"╚{_fill('═', card_width)}╝{Colors.RESET}")
         
         # Display action text if provided
         if action_text:
-            print(f"{Colors.BRIGHT_WHITE}{action_text}{Colors.RESET}")
+            lines.append(f"{Colors.BRIGHT_WHITE}{action_text}{Colors.RESET}")
+        
+        self._write("\n".join(lines) + "\n")
             
     def display_run_progress(self, ice_encountered, current_ice_index, server_name):
         """Display a visual representation of the progress through a run"""
         total_ice = len(ice_encountered)
         if total_ice == 0:
             # No ICE on this server
-            print(f"{Colors.BRIGHT_GREEN}No ICE protecting {server_name}. Direct access!{Colors.RESET}")
+            self._write(f"{Colors.BRIGHT_GREEN}No ICE protecting {server_name}. Direct access!{Colors.RESET}\n")
             return
             
-        # Calculate progress
         passed_ice = current_ice_index
-        remaining_ice = total_ice - passed_ice
-        
-        # Header
-        print(f"\n{Colors.BRIGHT_BLUE}RUN PROGRESS: {Colors.RESET}{passed_ice}/{total_ice} ICE passed")
-        
-        # Create the progress visualization
-        progress_width = min(60, self.terminal_width - 10)
         
-        # Print the starting point (Runner)
-        print(f"{Colors.BRIGHT_MAGENTA}[RUNNER]", end="")
-        
-        # Print passed ICE
-        for i in range(passed_ice):
-            ice_color = Colors.BRIGHT_GREEN
-            print(f"{Colors.BRIGHT_BLACK}==={Colors.RESET}{ice_color}[X]{Colors.RESET}", end="")
-            
-        # Print current ICE (if any)
+        # Runner, passed ICE, current ICE, upcoming ICE, then the server
+        track = _RUN_TRACK_RUNNER + _RUN_TRACK_PASSED * passed_ice
         if current_ice_index < total_ice:
-            ice = ice_encountered[current_ice_index]
-            ice_str = f"[!]"  # Default representation
-            ice_color = Colors.BRIGHT_RED
-            print(f"{Colors.BRIGHT_BLACK}==={Colors.RESET}{ice_color}{ice_str}{Colors.RESET}", end="")
-            
-            # Print remaining ICE
-            for i in range(current_ice_index + 1, total_ice):
-                print(f"{Colors.BRIGHT_BLACK}===[ ]{Colors.RESET}", end="")
-        
-        # Print the server
-        print(f"{Colors.BRIGHT_BLACK}==={Colors.RESET}{Colors.BRIGHT_CYAN}[{server_name}]{Colors.RESET}")
+            track += _RUN_TRACK_CURRENT + _RUN_TRACK_UPCOMING * (total_ice - current_ice_index - 1)
+        track += f"{Colors.BRIGHT_BLACK}==={Colors.RESET}{Colors.BRIGHT_CYAN}[{server_name}]{Colors.RESET}"
         
-        # Show legend
-        print(f"\n{Colors.BRIGHT_GREEN}[X]{Colors.RESET} = Passed ICE   " +
-              f"{Colors.BRIGHT_RED}[!]{Colors.RESET} = Current ICE   " +
-              f"{Colors.BRIGHT_BLACK}[ ]{Colors.RESET} = Upcoming ICE\n")
+        lines = [
+            f"\n{Colors.BRIGHT_BLUE}RUN PROGRESS: {Colors.RESET}{passed_ice}/{total_ice} ICE passed",
+            track,
+            _RUN_TRACK_LEGEND,
+        ]
+        self._write("\n".join(lines) + "\n")
             
+
+class NullRenderer(TerminalRenderer):
+    """Renderer that discards all output, for headless games and batch simulation"""
+    
+    enabled = False
+    
+    def __init__(self):
+        """Initialize only what the inherited helpers read; nothing is ever shown"""
+        self.status_line = ""
+        self.prompt_text = "> "
+        self._out_buf = []
+    
+    def flush(self):
+        """Discard flushed output"""
+    
+    def clear_screen(self):
+        """Discard screen clearing"""
+    
+    def output(self, text):
+        """Discard output"""
+    
+    def output_error(self, text):
+        """Discard error output"""
+    
+    def output_warning(self, text):
+        """Discard warning output"""
+    
+    def output_success(self, text):
+        """Discard success output"""
+    
+    def output_ascii_art(self, art_name):
+        """Discard ASCII art output"""
+    
+    def update_status(self, status_text):
+        """Discard status bar updates"""
+    
+    def display_prompt(self):
+        """Discard prompt display"""
+    
+    def display_header(self):
+        """Discard header display"""
+    
+    def display_welcome(self):
+        """Discard welcome display"""
+    
+    def display_command_help(self, valid_commands):
+        """Discard command help display"""
+    
+    def display_card_details(self, card):
+        """Discard card detail display"""
+    
+    def display_running_animation(self, target_server):
+        """Discard the running animation"""
+    
+    def display_ice_encounter(self, ice_card):
+        """Discard ICE encounter display"""
+    
+    def display_turn_start(self, turn_number, player_side):
+        """Discard the turn start banner"""
+    
+    def display_game_over(self, winner, message):
+        """Discard the game over screen"""
+    
+    def display_mini_card(self, card, action_text=None):
+        """Discard mini card display"""
+    
+    def display_run_progress(self, ice_encountered, current_ice_index, server_name):
+        """Discard run progress display"""
@@ -9,15 +9,90 @@ import sys
 import time
 import subprocess
 import argparse
+import codecs
+import functools
 import re
+import select
 
 # Import the game board renderer
 import game_board_render
 
+# ANSI color/style escape sequences, compiled once at import
+_ANSI_RE = re.compile(r'\x1b[^m]*m')
+
+# Game output lines the board reacts to, matched in a single scan per line
+_EVENT_RE = re.compile(
+    r'(?P<status>Credits:)'
+    r'|(?P<run>INITIATING RUN ON)'
+    r'|(?P<ice>ICE ENCOUNTERED:)'
+    r'|(?P<success>RUN SUCCESSFUL)'
+    r'|(?P<install>Installing .* for .* credits)'
+)
+
+# Status bar fields, in the order the game prints them
+_STATUS_RE = re.compile(r'Credits:\s*(\d+).*?Clicks:\s*(\d+)/\d+.*?MU:\s*(\d+)/(\d+)')
+
+# Standard server mapping from the game's run announcements to board names
+_SERVER_MAP = {
+    'HQ': 'HQ',
+    'R&D': 'R&D',
+    'ARCHIVES': 'Archives',
+    'SERVER 1': 'Server 1',
+    'SERVER1': 'Server 1'
+}
+
+# Minimum time between board redraws, in seconds
+_RENDER_INTERVAL = 0.1
+
+# Bytes requested per read of the game's output pipe
+_READ_SIZE = 65536
+
+@functools.lru_cache(maxsize=128)
 def clean_ansi(text):
     """Remove ANSI escape codes from text"""
-    ansi_escape = re.compile(r'\x1b[^m]*m')
-    return ansi_escape.sub('', text)
+    # Most lines carry no escapes at all; skip the regex for those
+    if '\x1b' not in text:
+        return text
+    return _ANSI_RE.sub('', text)
+
+def read_output_chunks(stream, idle_timeout):
+    """
+    Yield decoded output from a pipe in large chunks of whole lines
+    
+    Yields None whenever no output arrives for idle_timeout seconds, so the
+    caller can catch up on deferred work while the game is quiet. On Windows,
+    where select() only accepts sockets, the pipe is read blocking instead and
+    no idle ticks are produced; deferred work then waits for the next output.
+    """
+    fd = stream.fileno()
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    carry = ''
+    can_wait = os.name != 'nt'
+    while True:
+        if can_wait:
+            ready, _, _ = select.select([fd], [], [], idle_timeout)
+            if not ready:
+                yield None
+                continue
+        data = os.read(fd, _READ_SIZE)
+        if not data:
+            break
+        text = carry + decoder.decode(data)
+        # Hold back a trailing partial line until the rest of it arrives
+        cut = text.rfind('\n') + 1
+        carry = text[cut:]
+        if cut:
+            yield text[:cut]
+    carry += decoder.decode(b'', final=True)
+    if carry:
+        yield carry
+
+def render_board(board_state):
+    """Redraw the game board, reporting rather than raising render errors"""
+    try:
+        game_board_render.display_board(board_state)
+    except Exception as e:
+        print(f"Error updating board: {e}")
 
 def run_game_with_renderer(scenario='basic', delay=1, seed=None):
     """
@@ -51,8 +126,7 @@ def run_game_with_renderer(scenario='basic', delay=1, seed=None):
         cmd, 
         stdout=subprocess.PIPE, 
         stderr=subprocess.STDOUT,
-        universal_newlines=True,
-        bufsize=1
+        bufsize=0
     )
     
     # Track game state
@@ -63,109 +137,100 @@ def run_game_with_renderer(scenario='basic', delay=1, seed=None):
     clicks = 4
     runner_cards = []
     
-    # Process output line by line
-    for line in iter(process.stdout.readline, ''):
-        print(line, end='')  # Echo to console
-        
-        # Parse game state from output
-        if "Credits:" in line and "MU:" in line and "Clicks:" in line:
-            parts = line.split('|')
-            for part in parts:
-                if "Credits:" in part:
-                    try:
-                        credits = int(part.split(':')[1].strip())
-                    except:
-                        pass
-                if "MU:" in part:
-                    try:
-                        mu_parts = part.split(':')[1].strip().split('/')
-                        memory = [int(mu_parts[0]), int(mu_parts[1])]
-                    except:
-                        pass
-                if "Clicks:" in part:
-                    try:
-                        click_parts = part.split(':')[1].strip().split('/')
-                        clicks = int(click_parts[0])
-                    except:
-                        pass
+    # The one state dict handed to the board renderer, updated in place
+    board = {
+        'run_server': None,
+        'ice_index': 0,
+        'ice_encounter': False,
+        'run_success': False,
+        'credits': credits,
+        'memory': memory,
+        'clicks': clicks
+    }
+    last_state = None  # What the board was last asked to show
+    pending = False  # Whether the board has changes not yet drawn
+    last_render = 0.0
+    
+    # Process output a chunk at a time; None means the game has gone quiet
+    for chunk in read_output_chunks(process.stdout, _RENDER_INTERVAL):
+        if chunk:
+            sys.stdout.write(chunk)  # Echo to console
         
-        # Detect run initiation
-        if "INITIATING RUN ON" in line:
-            parts = line.split("INITIATING RUN ON")
-            if len(parts) > 1:
-                server_name = clean_ansi(parts[1].strip().rstrip('.'))
-                
-                # Standard server mapping
-                server_map = {
-                    'HQ': 'HQ',
-                    'R&D': 'R&D',
-                    'ARCHIVES': 'Archives',
-                    'SERVER 1': 'Server 1',
-                    'SERVER1': 'Server 1'
-                }
-                
-                current_server = server_map.get(server_name.upper(), server_name)
+        for match in _EVENT_RE.finditer(chunk or ''):
+            event = match.lastgroup
+            line_end = chunk.find('\n', match.end())
+            if line_end < 0:
+                line_end = len(chunk)
+            
+            # Parse game state from output
+            if event == 'status':
+                status = _STATUS_RE.match(chunk, match.start(), line_end)
+                if status:
+                    credits = int(status.group(1))
+                    clicks = int(status.group(2))
+                    memory = [int(status.group(3)), int(status.group(4))]
+                continue
+            
+            # Detect run initiation
+            elif event == 'run':
+                server_name = clean_ansi(chunk[match.end():line_end].strip().rstrip('.'))
+                current_server = _SERVER_MAP.get(server_name.upper(), server_name)
                 ice_index = 0
                 
                 # Update game board for run
-                try:
-                    game_board_render.display_board({
-                        'run_server': current_server,
-                        'ice_index': ice_index,
-                        'credits': credits,
-                        'memory': memory,
-                        'clicks': clicks
-                    })
-                    time.sleep(1)  # Pause to show the board
-                except Exception as e:
-                    print(f"Error updating board: {e}")
-        
-        # Detect ICE encounters
-        if "ICE ENCOUNTERED:" in line:
-            if current_server:
+                board.update(run_server=current_server, ice_index=ice_index,
+                             ice_encounter=False, run_success=False)
+            
+            # Detect ICE encounters
+            elif event == 'ice':
+                if not current_server:
+                    continue
                 # Update game board to show ice encounter
-                try:
-                    game_board_render.display_board({
-                        'run_server': current_server,
-                        'ice_index': ice_index,
-                        'ice_encounter': True,
-                        'credits': credits,
-                        'memory': memory,
-                        'clicks': clicks
-                    })
-                    time.sleep(1)  # Pause to show the encounter
-                    ice_index += 1  # Move to next ice
-                except Exception as e:
-                    print(f"Error updating ice encounter: {e}")
-        
-        # Detect successful run
-        if "RUN SUCCESSFUL" in line:
-            # Show run success animation
-            try:
-                game_board_render.display_board({
-                    'run_server': current_server,
-                    'run_success': True,
-                    'credits': credits,
-                    'memory': memory,
-                    'clicks': clicks
-                })
-                time.sleep(1)  # Pause to show success
+                board.update(run_server=current_server, ice_index=ice_index,
+                             ice_encounter=True, run_success=False)
+                ice_index += 1  # Move to next ice
+            
+            # Detect successful run
+            elif event == 'success':
+                # Show run success animation
+                board.update(run_server=current_server, ice_index=0,
+                             ice_encounter=False, run_success=True)
                 current_server = None
-            except Exception as e:
-                print(f"Error showing run success: {e}")
+            
+            # Detect card installation or other major game state changes
+            elif event == 'install':
+                # Update game board to reflect installed card
+                board.update(run_server=None, ice_index=0,
+                             ice_encounter=False, run_success=False)
+            
+            board.update(credits=credits, memory=memory, clicks=clicks)
+            
+            # Redraw only when the board would actually look different
+            state_key = (
+                board['run_server'],
+                board['ice_index'],
+                board['ice_encounter'],
+                board['run_success'],
+                credits,
+                tuple(memory),
+                clicks
+            )
+            if state_key != last_state:
+                last_state = state_key
+                pending = True
         
-        # Detect card installation or other major game state changes
-        if "Installing" in line and "for" in line and "credits" in line:
-            # Update game board to reflect installed card
-            try:
-                game_board_render.display_board({
-                    'credits': credits,
-                    'memory': memory,
-                    'clicks': clicks
-                })
-                time.sleep(0.5)  # Brief pause
-            except Exception as e:
-                print(f"Error updating after installation: {e}")
+        # Coalesce bursts of changes: only the latest state is drawn, at most
+        # once per _RENDER_INTERVAL
+        if pending:
+            now = time.monotonic()
+            if now - last_render >= _RENDER_INTERVAL:
+                render_board(board)
+                pending = False
+                last_render = now
+    
+    # Draw whatever the final burst left behind
+    if pending:
+        render_board(board)
     
     # Wait for process to complete
     process.wait()
@@ -6,31 +6,97 @@ A terminal-based implementation of the game for testing gameplay mechanics
 
 import sys
 import os
-import random
+import secrets
 import time
 import argparse
+import select
 from terminal_game import TerminalGame
 from game_renderer import TerminalRenderer
 from card_data import load_cards
 
+# Test scenarios: name -> the commands to run, in order
+_SCENARIOS = {
+    'quick': (
+        "hand",
+        "draw",
+        "install 1",
+        "run R&D",
+        "end"
+    ),
+    'install': (
+        "hand",
+        "draw",
+        "install 1",
+        "installed",
+        "memory",
+        "credits",
+        "draw",
+        "install 2",
+        "installed",
+        "memory"
+    ),
+    'run': (
+        "hand",
+        "draw",
+        "install 1",
+        "run R&D",
+        "run HQ",
+        "run Archives",
+        "end"
+    ),
+    'full': (
+        # Turn 1 - Installation and basic actions
+        "help",         # Start with basic help to see available commands
+        "system",       # Check system status
+        "hand",         # Check initial hand
+        "credits",      # Check credits
+        "memory",       # Check memory status
+        "draw",         # Draw a card (+1 click)
+        "hand",         # Check updated hand after drawing
+        "install 1",    # Install first card (+3 click)
+        "installed",    # Check installed programs
+        "memory",       # Check memory status after installation
+        "run R&D",      # Run on R&D server (+4 click)
+        "end",          # End turn to see corporation's turn
+        
+        # Turn 2 - More installations and runs
+        "hand",         # Check hand after corp turn
+        "draw",         # Draw a card (+1 click)
+        "install 2",    # Install second card (+2 click)
+        "install 3",    # Install third card (+3 click)
+        "run HQ",       # Run on HQ server (+4 click)
+        "end",          # End turn
+        
+        # Turn 3 - Economic actions and server run
+        "credits",      # Check credit status
+        "draw",         # Draw a card (+1 click)
+        "draw",         # Draw another card (+2 click)
+        "hand",         # Check hand
+        "run Archives", # Run archives (+3 click)
+        "run R&D",      # Run R&D (+4 click)
+        "end"           # End final turn
+    )
+}
+
 def parse_arguments():
     parser = argparse.ArgumentParser(description='Neon Dominance Terminal Game')
     parser.add_argument('--seed', type=int, default=None, help='Random seed for reproducible gameplay')
     parser.add_argument('--test', action='store_true', help='Run in test mode with automated commands')
     parser.add_argument('--scenario', type=str, default='quick', 
-                      choices=['quick', 'install', 'run', 'full'], 
+                      choices=list(_SCENARIOS), 
                       help='Test scenario to run')
     parser.add_argument('--delay', type=float, default=0.5, 
                       help='Delay between automated commands in seconds')
+    parser.add_argument('--no-delay', dest='delay', action='store_const', const=0,
+                      help='Run test scenarios without any pauses (same as --delay 0)')
     return parser.parse_args()
 
 def main():
     # Parse command line arguments
     args = parse_arguments()
     
-    # Set random seed if provided
-    seed_value = args.seed if args.seed is not None else random.randint(1, 100000)
-    random.seed(seed_value)
+    # Pick a seed if none was given; the game and AI each seed their own generator from it
+    seed_value = args.seed if args.seed is not None else secrets.randbits(32)
     print(f"Using random seed: {seed_value}")
     
     # Initialize terminal renderer
@@ -50,6 +116,7 @@ def main():
         # Interactive game loop
         run_interactive_game(game, renderer)
     
+    renderer.flush()
     print("\nThanks for playing Neon Dominance Terminal Game!")
     return 0
 
@@ -71,98 +138,58 @@ def run_interactive_game(game, renderer):
             game.process_command(command)
             
         except KeyboardInterrupt:
+            renderer.flush()
             print("\nGame terminated by user.")
             break
         except Exception as e:
+            renderer.flush()
             print(f"\nError: {e}")
             # In a real game, we might want to continue despite errors
 
+def pause(seconds):
+    """Wait between scenario steps; pressing Enter ends the wait early"""
+    # select() cannot watch stdin on Windows, and redirected input would end
+    # every wait at once, so only an interactive POSIX terminal is watched
+    if os.name == 'nt' or not (sys.stdin and sys.stdin.isatty()):
+        time.sleep(seconds)
+        return
+    ready, _, _ = select.select([sys.stdin], [], [], seconds)
+    if ready:
+        sys.stdin.readline()
+
 def run_test_scenario(game, renderer, scenario_name, delay):
     """Run a predefined test scenario with automated commands"""
-    # Define test scenarios
-    scenarios = {
-        'quick': [
-            "hand",
-            "draw",
-            "install 1",
-            "run R&D",
-            "end"
-        ],
-        'install': [
-            "hand",
-            "draw",
-            "install 1",
-            "installed",
-            "memory",
-            "credits",
-            "draw",
-            "install 2",
-            "installed",
-            "memory"
-        ],
-        'run': [
-            "hand",
-            "draw",
-            "install 1",
-            "run R&D",
-            "run HQ",
-            "run Archives",
-            "end"
-        ],
-        'full': [
-            # Turn 1 - Installation and basic actions
-            "help",         # Start with basic help to see available commands
-            "system",       # Check system status
-            "hand",         # Check initial hand
-            "credits",      # Check credits
-            "memory",       # Check memory status
-            "draw",         # Draw a card (+1 click)
-            "hand",         # Check updated hand after drawing
-            "install 1",    # Install first card (+3 click)
-            "installed",    # Check installed programs
-            "memory",       # Check memory status after installation
-            "run R&D",      # Run on R&D server (+4 click)
-            "end",          # End turn to see corporation's turn
-            
-            # Turn 2 - More installations and runs
-            "hand",         # Check hand after corp turn
-            "draw",         # Draw a card (+1 click)
-            "install 2",    # Install second card (+2 click)
-            "install 3",    # Install third card (+3 click)
-            "run HQ",       # Run on HQ server (+4 click)
-            "end",          # End turn
-            
-            # Turn 3 - Economic actions and server run
-            "credits",      # Check credit status
-            "draw",         # Draw a card (+1 click)
-            "draw",         # Draw another card (+2 click)
-            "hand",         # Check hand
-            "run Archives", # Run archives (+3 click)
-            "run R&D",      # Run R&D (+4 click)
-            "end"           # End final turn
-        ]
-    }
-    
     # Get the commands for the selected scenario
-    commands = scenarios.get(scenario_name, scenarios['quick'])
+    commands = _SCENARIOS.get(scenario_name, _SCENARIOS['quick'])
     
+    renderer.flush()
     print(f"\n========== RUNNING TEST SCENARIO: {scenario_name.upper()} ==========")
     print(f"Will execute {len(commands)} commands with {delay}s delay between commands")
-    time.sleep(1)  # Brief pause before starting
+    if delay > 0:
+        pause(1)  # Brief pause before starting
+    
+    # Bind the per-command calls to locals for the loop
+    process_command = game.process_command
+    display_prompt = renderer.display_prompt
+    flush = renderer.flush
+    sleep = pause
+    total = len(commands)
     
     # Execute each command
-    for i, cmd in enumerate(commands):
-        print(f"\n>> EXECUTING COMMAND {i+1}/{len(commands)}: '{cmd}'")
+    for i, cmd in enumerate(commands, 1):
+        print(f"\n>> EXECUTING COMMAND {i}/{total}: '{cmd}'")
         
         # Display the command as if the user typed it
-        renderer.display_prompt()
+        display_prompt()
         print(cmd)
         
         # Process the command
-        game.process_command(cmd)
+        process_command(cmd)
+        flush()
         
         # Wait before executing next command
-        time.sleep(delay)
+        if delay > 0:
+            sleep(delay)
     
     print("\n========== TEST SCENARIO COMPLETED ==========")
 
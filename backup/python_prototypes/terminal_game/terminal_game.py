@@ -3,10 +3,13 @@
 Terminal Game - Core game logic for the terminal-based mode
 """
 
+import copy
 import random
+from collections import deque
 from enum import Enum
+from types import MappingProxyType
 from ai_opponent import AIOpponent
-from game_renderer import Colors
+from game_renderer import Colors, NullRenderer
 
 class GamePhase(Enum):
     SETUP = 0
@@ -16,12 +19,370 @@ class GamePhase(Enum):
     END_TURN = 4
     GAME_OVER = 5
 
+# Readable phase names for the status bar, computed once per enum member
+_PHASE_NAMES = {phase: phase.name.replace('_', ' ').title() for phase in GamePhase}
+
+# Central servers in display order, plus a set for membership checks
+_CENTRAL_SERVERS = ("R&D", "HQ", "ARCHIVES")
+_VALID_SERVERS = frozenset(_CENTRAL_SERVERS)
+
+# Servers the scripted Runner rotates through; only remote accesses can score agendas
+_SCRIPTED_RUN_TARGETS = _CENTRAL_SERVERS + ("REMOTE1", "REMOTE2", "REMOTE3")
+
+# Card types (lowercased) whose installation consumes memory units
+_MEMORY_TYPES = frozenset({'program', 'icebreaker', 'virus'})
+
+# Flavor values for the system command (four each, indexed by two random bits)
+_FIREWALL_STATUSES = ("Active", "Standby", "Enhanced", "Minimal")
+_ENCRYPTION_LEVELS = ("Standard", "Military-grade", "Quantum", "Polymorphic")
+
+# Run approach per command-line flag, and the message shown when taking it
+_APPROACH_FLAGS = {"--stealth": "stealth", "--aggressive": "aggressive", "--careful": "careful"}
+_APPROACH_MESSAGES = {
+    "stealth": "You take a stealthy approach, spending 1 credit on masking your signal.",
+    "aggressive": "You take an aggressive approach, focusing on power over subtlety.",
+    "careful": "You take a careful approach, focusing on safety.",
+}
+
+# Jack-out success modifier per ICE type
+_ICE_JACK_OUT_MODIFIERS = {
+    'code gate': -0.1,  # Harder to jack out from code gates
+    'sentry': -0.2,     # Much harder to jack out from sentries
+    'barrier': 0.1,     # Easier to jack out from barriers
+}
+
+# ICE the terminal Corp can place, shared read-only between runs
+_ICE_POOL = (
+    MappingProxyType({
+        'name': 'Ice Wall',
+        'type': 'Ice',
+        'subtype': 'Barrier',
+        'cost': 1,
+        'strength': 1,
+        'description': 'End the run.'
+    }),
+    MappingProxyType({
+        'name': 'Enigma',
+        'type': 'Ice',
+        'subtype': 'Code Gate',
+        'cost': 3,
+        'strength': 2,
+        'description': 'The Runner loses 1 click. End the run.'
+    }),
+    MappingProxyType({
+        'name': 'Rototurret',
+        'type': 'Ice',
+        'subtype': 'Sentry',
+        'cost': 4,
+        'strength': 0,
+        'description': 'Trash 1 program. End the run.'
+    }),
+    MappingProxyType({
+        'name': 'Neural Katana',
+        'type': 'Ice',
+        'subtype': 'Sentry',
+        'cost': 4,
+        'strength': 3,
+        'description': 'Do 3 net damage. End the run.'
+    }),
+    MappingProxyType({
+        'name': 'Wall of Static',
+        'type': 'Ice',
+        'subtype': 'Barrier',
+        'cost': 3,
+        'strength': 3,
+        'description': 'End the run.'
+    }),
+    MappingProxyType({
+        'name': 'Tollbooth',
+        'type': 'Ice',
+        'subtype': 'Code Gate',
+        'cost': 8,
+        'strength': 5,
+        'description': 'The Runner loses 3 credits, if able. End the run if the Runner cannot pay 3 credits.'
+    }),
+)
+
+# Candidates for each ICE position in a server: barrier, code gate, then sentries
+_ICE_SLOT_CANDIDATES = tuple(
+    tuple(ice for ice in _ICE_POOL if ice['subtype'] == subtype)
+    for subtype in ('Barrier', 'Code Gate', 'Sentry')
+)
+
+# What running each central server reveals: the access message and the (dummy) cards,
+# built once since they never change
+_CENTRAL_ACCESS = {
+    'R&D': ("You access the top card of R&D.", (
+        MappingProxyType({
+            'name': "Priority Directive",
+            'type': "Agenda",
+            'advancement_requirement': 3,
+            'agenda_points': 2,
+            'description': "When you score this agenda, you may rez a piece of ice ignoring all costs."
+        }),
+    )),
+    'HQ': ("You access a random card from HQ.", (
+        MappingProxyType({
+            'name': "Corporate Strategy",
+            'type': "Operation",
+            'cost': 2,
+            'description': "Gain 5 credits."
+        }),
+    )),
+    'ARCHIVES': ("You access 2 cards from Archives.", (
+        MappingProxyType({
+            'name': "Hedge Fund",
+            'type': "Operation",
+            'cost': 5,
+            'description': "Gain 9 credits."
+        }),
+        MappingProxyType({
+            'name': "Ice Wall",
+            'type': "Ice",
+            'subtype': "Barrier",
+            'cost': 1,
+            'strength': 1,
+            'description': "End the run."
+        }),
+    )),
+}
+
+# Card types a remote server may hold
+_REMOTE_CARD_TYPES = ("Asset", "Upgrade", "Agenda")
+
+def _card_type(card):
+    """Return a card's lowercase type, using the one cached at deck setup when present"""
+    return card.get('type_lc') or card.get('type', '').lower()
+
 class TerminalGame:
+    # Every attribute is set in __init__; slots keep instances dict-free
+    __slots__ = (
+        # Game dependencies
+        'renderer', 'cards_data', 'random_seed', '_rng',
+        # Game state
+        'player_credits', 'memory_units_available', 'memory_units_used',
+        'player_side', 'opponent_side',
+        # Game phases and turns
+        'current_phase', 'clicks_remaining', 'max_clicks', 'turn_number', 'active_player',
+        # Win conditions
+        'runner_agenda_points', 'corp_agenda_points',
+        'agenda_points_to_win', 'runner_cards_remaining', 'corp_cards_remaining',
+        'game_over', 'win_message',
+        # Card data
+        'player_deck', 'hand_cards', 'played_cards', 'selected_card_index',
+        '_turn_start_cards', '_installed_breakers', '_jack_out_assist_cards',
+        # Special gameplay flags
+        'bypass_next_ice', 'next_run_untraceable', 'current_run',
+        # Command history
+        'command_history', 'command_history_index',
+        # AI opponent
+        'ai_opponent', '_ai_state',
+        # Command dispatch and status bar cache
+        '_command_dispatch', '_last_status_key', '_last_status_text',
+    )
+    
+    # Map of valid commands to their descriptions
+    VALID_COMMANDS = MappingProxyType({
+        "help": "Display available commands and usage information",
+        "draw": "Draw a card from your deck",
+        "hand": "List all cards in your hand",
+        "install": "Install a program from your hand",
+        "run": "Initiate a run on a corporate server",
+        "jack_out": "Attempt to abort the current run",
+        "end": "End your current turn",
+        "info": "Display game state information",
+        "discard": "Discard a card from your hand",
+        "system": "Display system status",
+        "installed": "List all installed programs",
+        "credits": "Display credit account information",
+        "memory": "Display memory allocation information",
+        "man": "Display manual page for a command"
+    })
+
+    # Comprehensive command documentation (BSD-style)
+    COMMAND_MAN_PAGES = MappingProxyType({
+        "help": {
+            "NAME": "help - display help information about available commands",
+            "SYNOPSIS": "help [command]",
+            "DESCRIPTION": ("Display a list of available commands or specific information about a command. "
+                            "When invoked without arguments, help displays a list of all available commands. "
+                            "When invoked with a command name as an argument, displays detailed help for that command."),
+            "EXAMPLES": "help\nhelp install\nhelp run",
+            "SEE ALSO": "man"
+        },
+        "man": {
+            "NAME": "man - display manual page for commands",
+            "SYNOPSIS": "man <command>",
+            "DESCRIPTION": ("Display the manual page for the specified command. "
+                            "Provides detailed information about command usage, options, and functionality."),
+            "EXAMPLES": "man draw\nman install\nman run",
+            "SEE ALSO": "help"
+        },
+        "draw": {
+            "NAME": "draw - draw a card from your deck",
+            "SYNOPSIS": "draw",
+            "DESCRIPTION": ("Retrieves one file from your data stack and adds it to your hand. "
+                            "This operation costs 1 click during the action phase."),
+            "EXAMPLES": "draw",
+            "SEE ALSO": "hand, discard"
+        },
+        "hand": {
+            "NAME": "hand - list all cards in your hand",
+            "SYNOPSIS": "hand",
+            "DESCRIPTION": ("Displays a list of all files currently in your hand. "
+                            "Each entry includes the card name, type, and relevant stats."),
+            "EXAMPLES": "hand",
+            "SEE ALSO": "draw, install, discard"
+        },
+        "install": {
+            "NAME": "install - install a program from your hand",
+            "SYNOPSIS": "install <card_number>",
+            "DESCRIPTION": ("Installs a program from your hand onto your rig. "
+                            "This operation costs 1 click plus the program's credit cost. "
+                            "Programs also consume memory units which are limited by your available MU."),
+            "EXAMPLES": "install 2",
+            "SEE ALSO": "hand, installed, memory"
+        },
+        "run": {
+            "NAME": "run - initiate a run on a corporate server",
+            "SYNOPSIS": "run <server> [--stealth|--aggressive|--careful]",
+            "DESCRIPTION": ("Initiates a run against a specified corporate server. "
+                            "This operation costs 1 click. During a run, you will "
+                            "encounter ICE that must be broken using installed programs."),
+            "EXAMPLES": "run R&D\nrun HQ\nrun Archives",
+            "SEE ALSO": "installed"
+        },
+        "end": {
+            "NAME": "end - end your current turn",
+            "SYNOPSIS": "end",
+            "DESCRIPTION": ("Ends your current turn and passes to the next player. "
+                            "You must discard down to your maximum hand size (5) before ending your turn."),
+            "EXAMPLES": "end",
+            "SEE ALSO": "discard"
+        },
+        "info": {
+            "NAME": "info - display game state information",
+            "SYNOPSIS": "info",
+            "DESCRIPTION": ("Displays information about the current game state, "
+                            "including turn number, phase, active player, and score."),
+            "EXAMPLES": "info",
+            "SEE ALSO": "system, credits, memory"
+        },
+        "discard": {
+            "NAME": "discard - discard a card from your hand",
+            "SYNOPSIS": "discard <card_number>",
+            "DESCRIPTION": ("Discards a specified card from your hand. "
+                            "During the action phase, this operation costs 1 click. "
+                            "During the discard phase (end of turn), this operation is free."),
+            "EXAMPLES": "discard 3",
+            "SEE ALSO": "hand, draw"
+        },
+        "system": {
+            "NAME": "system - display system status",
+            "SYNOPSIS": "system",
+            "DESCRIPTION": ("Displays information about your system status, "
+                            "including neural interface integrity, trace detection, "
+                            "and connection encryption status."),
+            "EXAMPLES": "system",
+            "SEE ALSO": "info, memory, credits"
+        },
+        "installed": {
+            "NAME": "installed - list all installed programs",
+            "SYNOPSIS": "installed",
+            "DESCRIPTION": ("Displays a list of all programs currently installed on your rig. "
+                            "Each entry includes the program name, type, and relevant stats."),
+            "EXAMPLES": "installed",
+            "SEE ALSO": "install, memory"
+        },
+        "credits": {
+            "NAME": "credits - display credit account information",
+            "SYNOPSIS": "credits",
+            "DESCRIPTION": ("Displays information about your current credit balance, "
+                            "income rate, and available credit-related actions."),
+            "EXAMPLES": "credits",
+            "SEE ALSO": "info, memory"
+        },
+        "memory": {
+            "NAME": "memory - display memory allocation information",
+            "SYNOPSIS": "memory",
+            "DESCRIPTION": ("Displays information about your current memory usage, "
+                            "including total available memory units (MU), used MU, "
+                            "and a breakdown of memory usage by installed program."),
+            "EXAMPLES": "memory",
+            "SEE ALSO": "installed, info, system"
+        },
+        "jack_out": {
+            "NAME": "jack_out - attempt to abort the current run",
+            "SYNOPSIS": "jack_out",
+            "DESCRIPTION": ("Attempts to safely disconnect from the current run. "
+                            "Success chance depends on ICE type and installed programs. "
+                            "Failing to jack out may result in taking damage or other consequences."),
+            "EXAMPLES": "jack_out",
+            "SEE ALSO": "run"
+        },
+    })
+    
+    # Commands that only report state, so they can never change the winner
+    _READ_ONLY_COMMANDS = frozenset({"help", "man", "hand", "info", "system", "credits", "memory", "installed"})
+    # Read-only commands that do nothing but print; system is left out since it draws random numbers
+    _REPORT_ONLY_COMMANDS = _READ_ONLY_COMMANDS - {"system"}
+    
+    # Man pages rendered once, since their text never changes
+    _MAN_RENDERED = {
+        cmd: f"\nMANUAL: {cmd}\n" + "=" * (8 + len(cmd)) + "".join(
+            f"\n\n{section}\n    {content}" for section, content in man_page.items()
+        )
+        for cmd, man_page in COMMAND_MAN_PAGES.items()
+    }
+    
+    # General help listing, also fixed once the commands are defined
+    _HELP_TEXT_GENERAL = "\n".join(
+        ["\nTERMINAL COMMANDS:", "================="]
+        + [f"{cmd.ljust(10)} - {desc}" for cmd, desc in VALID_COMMANDS.items()]
+        + ["\nFor detailed information on a command, type 'help <command>' or 'man <command>'."]
+    )
+    
+    # Fixed report layouts, filled with one str.format call per command
+    _STATUS_TEMPLATE = "Turn: {} | Phase: {} | Player: {} | Credits: {} | Clicks: {}/{} | MU: {}/{}"
+    _INFO_TEMPLATE = (
+        "\nGAME INFORMATION:\n"
+        "================\n"
+        "Turn Number: {}\n"
+        "Active Player: {}\n"
+        "Current Phase: {}\n"
+        "Runner Agenda Points: {}/{}\n"
+        "Corp Agenda Points: {}/{}\n"
+        "Cards in Runner's Deck: {}"
+    )
+    _MEMORY_TEMPLATE = (
+        "\nMEMORY STATUS:\n"
+        "=============\n"
+        "Total Memory Units: {}\n"
+        "Used Memory Units:  {}\n"
+        "Free Memory Units:  {}"
+    )
+    _CREDITS_TEMPLATE = (
+        "\nCREDIT ACCOUNT:\n"
+        "==============\n"
+        "Available Credits: {}"
+    )
+    _SYSTEM_TEMPLATE = (
+        "\nSYSTEM STATUS:\n"
+        "=============\n"
+        "Neural Interface: Online\n"
+        "Connection Status: Secure\n"
+        "Trace Detection: None\n"
+        "System Integrity: 100%\n"
+        "Firewall Status: {}\n"
+        "Encryption Level: {}"
+    )
+    
     def __init__(self, renderer, cards, random_seed=0):
         # Game dependencies
         self.renderer = renderer
         self.cards_data = cards
         self.random_seed = random_seed
+        self._rng = random.Random(random_seed)  # Per-game generator, independent of global state
         
         # Game state
         self.player_credits = 5
@@ -47,9 +408,15 @@ class TerminalGame:
         self.win_message = ""
         
         # Card data
-        self.player_deck = []
+        self.player_deck = deque()
         self.hand_cards = []
         self.played_cards = []
+        # Installed cards with turn-start triggers, kept in install order
+        self._turn_start_cards = []
+        # Installed icebreaker-type cards, kept in install order for ICE encounters
+        self._installed_breakers = []
+        # Installed cards whose ability assists jacking out
+        self._jack_out_assist_cards = []
         self.selected_card_index = -1
         
         # Special gameplay flags
@@ -57,158 +424,31 @@ class TerminalGame:
         self.next_run_untraceable = False
         self.current_run = None  # Track the current run state
         
-        # Command history
-        self.command_history = []
+        # Command history, capped like a shell's so long sessions stay bounded
+        self.command_history = deque(maxlen=1000)
         self.command_history_index = -1
 
-        # AI opponent
+        # AI opponent, and the state snapshot handed to it each Corp turn
         self.ai_opponent = None
-
-        # Map of valid commands to their descriptions
-        self.valid_commands = {
-            "help": "Display available commands and usage information",
-            "draw": "Draw a card from your deck",
-            "hand": "List all cards in your hand",
-            "install": "Install a program from your hand",
-            "run": "Initiate a run on a corporate server",
-            "jack_out": "Attempt to abort the current run",
-            "end": "End your current turn",
-            "info": "Display game state information",
-            "discard": "Discard a card from your hand",
-            "system": "Display system status",
-            "installed": "List all installed programs",
-            "credits": "Display credit account information",
-            "memory": "Display memory allocation information",
-            "man": "Display manual page for a command"
+        self._ai_state = {
+            "turn_number": 0,
+            "runner_agenda_points": 0,
+            "runner_credits": 0,
+            "runner_programs": 0,
+            "runner_cards": 0,
         }
 
-        # Comprehensive command documentation (BSD-style)
-        self.command_man_pages = {
-            "help": {
-                "NAME": "help - display help information about available commands",
-                "SYNOPSIS": "help [command]",
-                "DESCRIPTION": "Display a list of available commands or specific information about a command. " +
-                              "When invoked without arguments, help displays a list of all available commands. " +
-                              "When invoked with a command name as an argument, displays detailed help for that command.",
-                "EXAMPLES": "help\nhelp install\nhelp run",
-                "SEE ALSO": "man"
-            },
-            "man": {
-                "NAME": "man - display manual page for commands",
-                "SYNOPSIS": "man <command>",
-                "DESCRIPTION": "Display the manual page for the specified command. " +
-                              "Provides detailed information about command usage, options, and functionality.",
-                "EXAMPLES": "man draw\nman install\nman run",
-                "SEE ALSO": "help"
-            },
-            "draw": {
-                "NAME": "draw - draw a card from your deck",
-                "SYNOPSIS": "draw",
-                "DESCRIPTION": "Retrieves one file from your data stack and adds it to your hand. " +
-                              "This operation costs 1 click during the action phase.",
-                "EXAMPLES": "draw",
-                "SEE ALSO": "hand, discard"
-            },
-            "hand": {
-                "NAME": "hand - list all cards in your hand",
-                "SYNOPSIS": "hand",
-                "DESCRIPTION": "Displays a list of all files currently in your hand. " +
-                              "Each entry includes the card name, type, and relevant stats.",
-                "EXAMPLES": "hand",
-                "SEE ALSO": "draw, install, discard"
-            },
-            "install": {
-                "NAME": "install - install a program from your hand",
-                "SYNOPSIS": "install <card_number>",
-                "DESCRIPTION": "Installs a program from your hand onto your rig. " +
-                              "This operation costs 1 click plus the program's credit cost. " +
-                              "Programs also consume memory units which are limited by your available MU.",
-                "EXAMPLES": "install 2",
-                "SEE ALSO": "hand, installed, memory"
-            },
-            "run": {
-                "NAME": "run - initiate a run on a corporate server",
-                "SYNOPSIS": "run <server> [--stealth|--aggressive|--careful]",
-                "DESCRIPTION": "Initiates a run against a specified corporate server. " +
-                              "This operation costs 1 click. During a run, you will " +
-                              "encounter ICE that must be broken using installed programs.",
-                "EXAMPLES": "run R&D\nrun HQ\nrun Archives",
-                "SEE ALSO": "installed"
-            },
-            "end": {
-                "NAME": "end - end your current turn",
-                "SYNOPSIS": "end",
-                "DESCRIPTION": "Ends your current turn and passes to the next player. " +
-                              "You must discard down to your maximum hand size (5) before ending your turn.",
-                "EXAMPLES": "end",
-                "SEE ALSO": "discard"
-            },
-            "info": {
-                "NAME": "info - display game state information",
-                "SYNOPSIS": "info",
-                "DESCRIPTION": "Displays information about the current game state, " +
-                              "including turn number, phase, active player, and score.",
-                "EXAMPLES": "info",
-                "SEE ALSO": "system, credits, memory"
-            },
-            "discard": {
-                "NAME": "discard - discard a card from your hand",
-                "SYNOPSIS": "discard <card_number>",
-                "DESCRIPTION": "Discards a specified card from your hand. " +
-                              "During the action phase, this operation costs 1 click. " +
-                              "During the discard phase (end of turn), this operation is free.",
-                "EXAMPLES": "discard 3",
-                "SEE ALSO": "hand, draw"
-            },
-            "system": {
-                "NAME": "system - display system status",
-                "SYNOPSIS": "system",
-                "DESCRIPTION": "Displays information about your system status, " +
-                              "including neural interface integrity, trace detection, " +
-                              "and connection encryption status.",
-                "EXAMPLES": "system",
-                "SEE ALSO": "info, memory, credits"
-            },
-            "installed": {
-                "NAME": "installed - list all installed programs",
-                "SYNOPSIS": "installed",
-                "DESCRIPTION": "Displays a list of all programs currently installed on your rig. " +
-                              "Each entry includes the program name, type, and relevant stats.",
-                "EXAMPLES": "installed",
-                "SEE ALSO": "install, memory"
-            },
-            "credits": {
-                "NAME": "credits - display credit account information",
-                "SYNOPSIS": "credits",
-                "DESCRIPTION": "Displays information about your current credit balance, " +
-                              "income rate, and available credit-related actions.",
-                "EXAMPLES": "credits",
-                "SEE ALSO": "info, memory"
-            },
-            "memory": {
-                "NAME": "memory - display memory allocation information",
-                "SYNOPSIS": "memory",
-                "DESCRIPTION": "Displays information about your current memory usage, " +
-                              "including total available memory units (MU), used MU, " +
-                              "and a breakdown of memory usage by installed program.",
-                "EXAMPLES": "memory",
-                "SEE ALSO": "installed, info, system"
-            },
-            "jack_out": {
-                "NAME": "jack_out - attempt to abort the current run",
-                "SYNOPSIS": "jack_out",
-                "DESCRIPTION": "Attempts to safely disconnect from the current run. " +
-                              "Success chance depends on ICE type and installed programs. " +
-                              "Failing to jack out may result in taking damage or other consequences.",
-                "EXAMPLES": "jack_out",
-                "SEE ALSO": "run"
-            },
-        }
+        # Command name -> bound handler, so dispatch is a single dict lookup
+        self._command_dispatch = {cmd: getattr(self, f"_cmd_{cmd}") for cmd in self.VALID_COMMANDS}
+
+        # Last status bar inputs and text, reused while nothing changes
+        self._last_status_key = None
+        self._last_status_text = ""
 
     def initialize(self):
         """Initialize the game state and display welcome message"""
         # Set the random seed for consistent behavior
-        random.seed(self.random_seed)
+        self._rng.seed(self.random_seed)
         
         # Initialize AI opponent with the same seed
         self.ai_opponent = AIOpponent(self.random_seed)
@@ -221,25 +461,72 @@ class TerminalGame:
         self.current_phase = GamePhase.SETUP
         self.active_player = self.player_side
         
-        # Display welcome message and help
+        # Display welcome message, the opponent's strategy, and help
         self._display_welcome()
+        self.renderer.output(f"AI initialized with strategy: {self.ai_opponent.strategy.name}")
         self.process_command("help")
         
         # Start the game
         self.start_turn()
 
+    @classmethod
+    def simulate_batch(cls, cards, seeds, max_turns=100):
+        """Play one headless game per seed with a scripted Runner and tally the outcomes"""
+        results = {"runner": 0, "corp": 0, "unfinished": 0}
+        for seed in seeds:
+            # Games annotate and update card dicts, so each one plays its own copy
+            game = cls(NullRenderer(), copy.deepcopy(cards), seed)
+            game.initialize()
+            
+            # Every command either spends a click or ends the turn, so this bounds the game
+            for _ in range(max_turns * (game.max_clicks + 8)):
+                if game.game_over or game.turn_number > max_turns:
+                    break
+                game.process_command(game._next_scripted_command())
+                
+            if not game.game_over:
+                results["unfinished"] += 1
+            elif "Runner wins" in game.win_message:
+                results["runner"] += 1
+            else:
+                results["corp"] += 1
+        return results
+    
+    def _next_scripted_command(self):
+        """Pick the scripted Runner's next command: install what fits, keep cards in hand, else run"""
+        if self.current_phase is GamePhase.DISCARD:
+            return "discard 1" if len(self.hand_cards) > 5 else "end"
+        if self.clicks_remaining < 1:
+            return "end"
+            
+        memory_free = self.memory_units_available - self.memory_units_used
+        for i, card in enumerate(self.hand_cards):
+            if card.get('cost', 0) <= self.player_credits and card.get('mu', 0) <= memory_free:
+                return f"install {i + 1}"
+                
+        if len(self.hand_cards) < 3 and self.player_deck:
+            return "draw"
+        return f"run {_SCRIPTED_RUN_TARGETS[self.turn_number % len(_SCRIPTED_RUN_TARGETS)]}"
+
     def _initialize_deck(self):
         """Initialize the player deck with cards"""
         # Make sure cards are initialized
         if not hasattr(self, 'cards_data'):
             self._initialize_cards()
             
-        # Use the cards defined in _initialize_cards
-        self.player_deck = self.cards_data.copy()
+        # Lowercase each card type once so later checks compare without calling lower();
+        # the game works on its own copies so the caller's card dicts stay untouched
+        self.cards_data = [{**card, 'type_lc': card.get('type', '').lower()} for card in self.cards_data]
+            
+        # The deck holds card ids (indexes into cards_data); cards are looked up when drawn
+        deck = list(range(len(self.cards_data)))
         
         # Shuffle the deck
-        random.seed(self.random_seed)
-        random.shuffle(self.player_deck)
+        self._rng.seed(self.random_seed)
+        self._rng.shuffle(deck)
+        
+        # Cards are drawn from the top, so keep the deck in a deque
+        self.player_deck = deque(deck)
         
         # Set number of cards for status tracking
         self.runner_cards_remaining = len(self.player_deck)
@@ -249,13 +536,34 @@ class TerminalGame:
         starting_hand_size = 5
         for _ in range(starting_hand_size):
             if self.player_deck:
-                self.hand_cards.append(self.player_deck.pop(0))
+                self.hand_cards.append(self.cards_data[self.player_deck.popleft()])
                 self.runner_cards_remaining -= 1
 
     def _display_welcome(self):
         """Display the welcome message for the terminal game"""
         self.renderer.display_welcome()
-        self.renderer.display_command_help(self.valid_commands)
+        self.renderer.display_command_help(self.VALID_COMMANDS)
+
+    def _index_installed_card(self, card):
+        """File a newly installed card under the turn-start, ICE and jack-out events it takes part in"""
+        if _card_type(card) == 'icebreaker':
+            # Add basic icebreaker ability if not present
+            if 'ability' not in card:
+                card['ability'] = {
+                    'type': 'break_ice',
+                    'ice_types': ['all'],
+                    'max_strength': card.get('strength', 2)
+                }
+            self._installed_breakers.append(card)
+            
+        ability = card.get('ability')
+        if not ability:
+            return
+        ability_type = ability.get('type')
+        if ability_type == 'trigger' and ability.get('trigger') == 'turn_start':
+            self._turn_start_cards.append(card)
+        elif ability_type == 'jack_out_assist':
+            self._jack_out_assist_cards.append(card)
 
     def _process_card_ability(self, card, trigger=None, context=None):
         """
@@ -274,7 +582,7 @@ class TerminalGame:
             # For our terminal implementation, we'll handle some special cases even without formal ability definitions
             
             # Check for cards that might give credits on successful runs
-            if trigger == 'successful_run' and card.get('type', '').lower() == 'resource':
+            if trigger == 'successful_run' and _card_type(card) == 'resource':
                 if 'data mining' in card.get('name', '').lower():
                     self.player_credits += 1
                     return f"Gained 1 credit from {card['name']}"
@@ -283,122 +591,140 @@ class TerminalGame:
             return None
             
         ability = card['ability']
-        ability_type = ability.get('type')
+        handler = self._ABILITY_HANDLERS.get(ability.get('type'))
+        if handler is None:
+            return None
+        return handler(self, card, ability, trigger, context)
+
+    def _ability_break_ice(self, card, ability, trigger, context):
+        """Check whether an icebreaker can break the ICE being encountered"""
+        if trigger != 'encounter_ice' or not context or 'ice' not in context:
+            return None
+            
+        ice = context['ice']
+        ice_types = ability.get('ice_types', [])
+        max_strength = ability.get('max_strength', 0)
+        strength_bonus = context.get('strength_bonus', 0)
         
-        # Break ice ability specific handling
-        if ability_type == 'break_ice' and trigger == 'encounter_ice':
-            if not context or 'ice' not in context:
-                return None
-                
-            ice = context['ice']
-            ice_types = ability.get('ice_types', [])
-            max_strength = ability.get('max_strength', 0)
-            strength_bonus = context.get('strength_bonus', 0)
-            
-            # Check if this breaker can handle the encountered ICE
-            ice_subtype = ice.get('subtype', '').lower()
-            ice_strength = ice.get('strength', 0)
-            
-            can_break = ('all' in [t.lower() for t in ice_types] or 
-                        ice_subtype in [t.lower() for t in ice_types])
-                        
-            effective_strength = max_strength + strength_bonus
-            
-            if can_break and effective_strength >= ice_strength:
-                return f"Used {card['name']} to successfully break {ice['name']} subroutines"
-            else:
-                if not can_break:
-                    return f"{card['name']} can't break {ice_subtype} ICE"
-                else:
-                    return f"{card['name']} strength ({effective_strength}) is not enough for {ice['name']} ({ice_strength})"
-            
-        # Handle permanent abilities
-        elif ability_type == 'permanent':
-            # These are handled at installation time and don't need trigger checks
-            if trigger == 'install':
-                effects = ability.get('effects', [])
-                if not effects:  # Single effect
-                    effect = ability.get('effect')
-                    value = ability.get('value', 0)
-                    if effect == 'increase_memory':
-                        self.memory_units_available += value
-                        return f"Memory capacity increased by {value} units"
-                    elif effect == 'increase_hand_size':
-                        # Implement hand size increase
-                        return f"Hand size increased by {value}"
-                else:  # Multiple effects
-                    messages = []
-                    for effect_data in effects:
-                        effect = effect_data.get('effect')
-                        value = effect_data.get('value', 0)
-                        if effect == 'increase_memory':
-                            self.memory_units_available += value
-                            messages.append(f"Memory capacity increased by {value} units")
-                        elif effect == 'increase_hand_size':
-                            # Implement hand size increase
-                            messages.append(f"Hand size increased by {value}")
-                    return "; ".join(messages) if messages else None
+        # Check if this breaker can handle the encountered ICE
+        ice_subtype = ice.get('subtype', '').lower()
+        ice_strength = ice.get('strength', 0)
+        
+        ice_types = {t.lower() for t in ice_types}
+        can_break = 'all' in ice_types or ice_subtype in ice_types
                     
-        # Handle triggered abilities
-        elif ability_type == 'trigger':
-            ability_trigger = ability.get('trigger')
-            
-            # Only process if the trigger matches
-            if ability_trigger != trigger:
-                return None
-                
-            effect = ability.get('effect')
-            value = ability.get('value', 0)
-            
-            # Handle different effect types
-            if effect == 'gain_credits':
-                self.player_credits += value
-                return f"Gained {value} credits from {card['name']}"
-            elif effect == 'draw_cards':
-                # Not implementing card drawing in this demo terminal version
-                return f"Drew {value} cards from {card['name']}"
-                
-        # Handle resource usage (like spending counters)
-        elif ability_type == 'resource' and trigger == 'use':
-            usage_type = ability.get('usage')
-            if not context or 'action' not in context:
-                return None
-                
-            if usage_type == context['action'] and card.get('counters', 0) > 0:
-                card['counters'] = card.get('counters', 0) - 1
-                return f"Used {card['name']} to assist with {context['action']}"
+        effective_strength = max_strength + strength_bonus
         
+        if can_break and effective_strength >= ice_strength:
+            return f"Used {card['name']} to successfully break {ice['name']} subroutines"
+        else:
+            if not can_break:
+                return f"{card['name']} can't break {ice_subtype} ICE"
+            else:
+                return f"{card['name']} strength ({effective_strength}) is not enough for {ice['name']} ({ice_strength})"
+
+    def _ability_permanent(self, card, ability, trigger, context):
+        """Apply permanent effects; these only act at installation time"""
+        if trigger != 'install':
+            return None
+            
+        effects = ability.get('effects', [])
+        if not effects:  # Single effect
+            return self._apply_permanent_effect(ability.get('effect'), ability.get('value', 0))
+            
+        # Multiple effects
+        messages = []
+        for effect_data in effects:
+            message = self._apply_permanent_effect(effect_data.get('effect'), effect_data.get('value', 0))
+            if message:
+                messages.append(message)
+        return "; ".join(messages) if messages else None
+
+    def _apply_permanent_effect(self, effect, value):
+        """Apply a single permanent effect and describe it"""
+        if effect == 'increase_memory':
+            self.memory_units_available += value
+            return f"Memory capacity increased by {value} units"
+        elif effect == 'increase_hand_size':
+            # Implement hand size increase
+            return f"Hand size increased by {value}"
         return None
 
+    def _ability_trigger(self, card, ability, trigger, context):
+        """Fire a triggered ability when its trigger matches the event"""
+        # Only process if the trigger matches
+        if ability.get('trigger') != trigger:
+            return None
+            
+        effect = ability.get('effect')
+        value = ability.get('value', 0)
+        
+        # Handle different effect types
+        if effect == 'gain_credits':
+            self.player_credits += value
+            return f"Gained {value} credits from {card['name']}"
+        elif effect == 'draw_cards':
+            # Not implementing card drawing in this demo terminal version
+            return f"Drew {value} cards from {card['name']}"
+        return None
+
+    def _ability_resource(self, card, ability, trigger, context):
+        """Spend a counter from a resource that assists with the current action"""
+        if trigger != 'use' or not context or 'action' not in context:
+            return None
+            
+        if ability.get('usage') == context['action'] and card.get('counters', 0) > 0:
+            card['counters'] = card.get('counters', 0) - 1
+            return f"Used {card['name']} to assist with {context['action']}"
+        return None
+
+    # Ability type -> handler, so _process_card_ability does one dict lookup
+    _ABILITY_HANDLERS = {
+        'break_ice': _ability_break_ice,
+        'permanent': _ability_permanent,
+        'trigger': _ability_trigger,
+        'resource': _ability_resource,
+    }
+
     def process_command(self, command_text):
         """Process a command from the terminal"""
-        # Add to command history
-        self.command_history.append(command_text)
-        self.command_history_index = -1
-        
-        # Check if game is over
+        # Check if game is over before doing any other work
         if self.game_over:
             self.renderer.output("Game is over. Type 'exit' to quit.")
             return
             
+        # Add to command history
+        self.command_history.append(command_text)
+        self.command_history_index = -1
+        
         # Parse the command
         parts = command_text.strip().split()
         if not parts:
             return
             
-        cmd = parts[0].lower()
+        # Commands are usually typed in lowercase already; only fold case on a miss
+        cmd = parts[0]
         args = parts[1:]
         
         # Check if command is valid
-        if cmd not in self.valid_commands:
+        command_method = self._command_dispatch.get(cmd)
+        if command_method is None:
+            cmd = cmd.lower()
+            command_method = self._command_dispatch.get(cmd)
+        if command_method is None:
             self.renderer.output_error(f"Unknown command: {cmd}")
             self.renderer.output("Type 'help' for a list of commands")
             return
             
+        # Reports have no effect without a renderer that shows them
+        if cmd in self._REPORT_ONLY_COMMANDS and not self.renderer.enabled:
+            return
+            
         # Execute the command
-        command_method = getattr(self, f"_cmd_{cmd}")
         command_method(args)
-        
+        if cmd in self._READ_ONLY_COMMANDS:
+            return
+            
         # Check win conditions after command
         self._check_win_conditions()
         
@@ -408,20 +734,22 @@ class TerminalGame:
 
     def _check_win_conditions(self):
         """Check if any win conditions have been met"""
+        to_win = self.agenda_points_to_win
+        
         # Runner agenda points win
-        if self.runner_agenda_points >= self.agenda_points_to_win:
+        if self.runner_agenda_points >= to_win:
             self.game_over = True
-            self.win_message = f"Runner wins by collecting {self.agenda_points_to_win} agenda points!"
+            self.win_message = f"Runner wins by collecting {to_win} agenda points!"
             return True
             
         # Corp agenda points win
-        if self.corp_agenda_points >= self.agenda_points_to_win:
+        if self.corp_agenda_points >= to_win:
             self.game_over = True
-            self.win_message = f"Corporation wins by scoring {self.agenda_points_to_win} agenda points!"
+            self.win_message = f"Corporation wins by scoring {to_win} agenda points!"
             return True
             
         # Runner deck empty
-        if self.runner_cards_remaining <= 0 and len(self.player_deck) == 0:
+        if self.runner_cards_remaining <= 0 and not self.player_deck:
             self.game_over = True
             self.win_message = "Corporation wins! Runner's deck is empty."
             return True
@@ -452,14 +780,9 @@ class TerminalGame:
             self.renderer.display_turn_start(self.turn_number, "runner")
             self.renderer.output(f"You have {self.clicks_remaining} clicks available.")
             
-            # Process turn start abilities
+            # Trigger "turn_start" abilities
             turn_start_effects = []
-            for card in self.played_cards:
-                # Reset per-turn flags
-                if 'ability' in card and card['ability'].get('type') == 'trigger' and card['ability'].get('frequency') == 'per_turn':
-                    card['used_this_turn'] = False
-                
-                # Trigger "turn_start" abilities
+            for card in self._turn_start_cards:
                 result = self._process_card_ability(card, trigger='turn_start')
                 if result:
                     turn_start_effects.append(result)
@@ -469,14 +792,17 @@ class TerminalGame:
                 self.renderer.output("\nTurn start effects:")
                 for effect in turn_start_effects:
                     self.renderer.output_success(f"• {effect}")
-                print()
+                self.renderer.output("")
                 
             self._update_status()
             self.current_phase = GamePhase.ACTION
         else:
             # Corporation's turn
             self._process_ai_turn()
-            
+            if self.game_over:
+                # Stay in GAME_OVER rather than starting another Runner turn
+                return
+                
             # After Corp turn, immediately start Runner's turn
             self.active_player = "runner"
             self.start_turn()
@@ -517,51 +843,56 @@ class TerminalGame:
         self.active_player = self.player_side
 
     def _get_game_state_for_ai(self):
-        """Prepare a game state object to pass to the AI"""
-        return {
-            "turn_number": self.turn_number,
-            "runner_agenda_points": self.runner_agenda_points,
-            "runner_credits": self.player_credits,
-            "runner_programs": len(self.played_cards),
-            "runner_cards": len(self.hand_cards),
-        }
+        """Refresh and return the game state passed to the AI (reused, so only valid for this turn)"""
+        state = self._ai_state
+        state["turn_number"] = self.turn_number
+        state["runner_agenda_points"] = self.runner_agenda_points
+        state["runner_credits"] = self.player_credits
+        state["runner_programs"] = len(self.played_cards)
+        state["runner_cards"] = len(self.hand_cards)
+        return state
 
     def _update_status(self):
         """Update the status bar with current game information"""
-        status = (
-            f"Turn: {self.turn_number} | "
-            f"Phase: {self._get_phase_name(self.current_phase)} | "
-            f"Player: {self.active_player} | "
-            f"Credits: {self.player_credits} | "
-            f"Clicks: {self.clicks_remaining}/{self.max_clicks} | "
-            f"MU: {self.memory_units_used}/{self.memory_units_available}"
+        key = (
+            self.turn_number, self.current_phase, self.active_player, self.player_credits,
+            self.clicks_remaining, self.max_clicks, self.memory_units_used, self.memory_units_available,
         )
-        self.renderer.update_status(status)
+        if key != self._last_status_key:
+            self._last_status_key = key
+            turn, phase, *rest = key
+            self._last_status_text = self._STATUS_TEMPLATE.format(turn, _PHASE_NAMES[phase], *rest)
+        self.renderer.update_status(self._last_status_text)
 
-    def _get_phase_name(self, phase):
-        """Convert phase enum to readable name"""
-        return phase.name.replace('_', ' ').title()
+    def _require_action_click(self, verb):
+        """Check that it is the action phase with a click left, reporting why not"""
+        if self.current_phase is not GamePhase.ACTION:
+            self.renderer.output_error(f"Can only {verb} during action phase")
+            return False
+        if self.clicks_remaining < 1:
+            self.renderer.output_error("Not enough clicks remaining")
+            return False
+        return True
 
     # Command implementations
     def _cmd_help(self, args):
         """Implement the help command"""
         if args:
             # Show help for specific command
-            cmd = args[0].lower()
-            if cmd in self.valid_commands:
-                self.renderer.output(f"\n{cmd.upper()} - {self.valid_commands[cmd]}")
-                if cmd in self.command_man_pages:
-                    self.renderer.output(f"Usage: {self.command_man_pages[cmd]['SYNOPSIS']}")
-                    self.renderer.output(f"For more details, try: man {cmd}")
+            cmd = args[0]
+            if cmd not in self.VALID_COMMANDS:
+                cmd = cmd.lower()
+            if cmd in self.VALID_COMMANDS:
+                lines = [f"\n{cmd.upper()} - {self.VALID_COMMANDS[cmd]}"]
+                if cmd in self.COMMAND_MAN_PAGES:
+                    lines.append(f"Usage: {self.COMMAND_MAN_PAGES[cmd]['SYNOPSIS']}")
+                    lines.append(f"For more details, try: man {cmd}")
+                self.renderer.output("\n".join(lines))
             else:
                 self.renderer.output_error(f"No help available for '{cmd}'. Type 'help' for a list of commands.")
         else:
             # Show general help
-            self.renderer.output("\nTERMINAL COMMANDS:")
-            self.renderer.output("=================")
-            for cmd, desc in self.valid_commands.items():
-                self.renderer.output(f"{cmd.ljust(10)} - {desc}")
-            self.renderer.output("\nFor detailed information on a command, type 'help <command>' or 'man <command>'.")
+            self.renderer.output(self._HELP_TEXT_GENERAL)
 
     def _cmd_man(self, args):
         """Implement the man command"""
@@ -570,25 +901,17 @@ class TerminalGame:
             self.renderer.output("Usage: man <command>")
             return
             
-        cmd = args[0].lower()
-        if cmd in self.command_man_pages:
-            man_page = self.command_man_pages[cmd]
-            self.renderer.output(f"\nMANUAL: {cmd}")
-            self.renderer.output("=" * (8 + len(cmd)))
-            for section, content in man_page.items():
-                self.renderer.output(f"\n{section}")
-                self.renderer.output(f"    {content}")
+        cmd = args[0]
+        if cmd not in self._MAN_RENDERED:
+            cmd = cmd.lower()
+        if cmd in self._MAN_RENDERED:
+            self.renderer.output(self._MAN_RENDERED[cmd])
         else:
             self.renderer.output_error(f"No manual entry for '{cmd}'")
 
     def _cmd_draw(self, args):
         """Implement the draw command"""
-        if self.current_phase != GamePhase.ACTION:
-            self.renderer.output_error("Can only draw during action phase")
-            return
-            
-        if self.clicks_remaining < 1:
-            self.renderer.output_error("Not enough clicks remaining")
+        if not self._require_action_click("draw"):
             return
             
         if not self.player_deck:
@@ -596,7 +919,7 @@ class TerminalGame:
             return
             
         # Draw a card
-        drawn_card = self.player_deck.pop(0)
+        drawn_card = self.cards_data[self.player_deck.popleft()]
         self.hand_cards.append(drawn_card)
         self.runner_cards_remaining -= 1
         self.clicks_remaining -= 1
@@ -613,10 +936,13 @@ class TerminalGame:
             self.renderer.output("Your hand is empty.")
             return
             
-        self.renderer.output("\nHAND CARDS:")
-        self.renderer.output("===========")
+        lines = []
+        lines.append("\nHAND CARDS:")
+        lines.append("===========")
         for i, card in enumerate(self.hand_cards):
-            self.renderer.output(f"[{i+1}] {card['name']} - {card['type']} - {card.get('cost', 0)}c {card.get('mu', 0)}mu")
+            lines.append(f"[{i+1}] {card['name']} - {card['type']} - {card.get('cost', 0)}c {card.get('mu', 0)}mu")
+        
+        self.renderer.output("\n".join(lines))
 
     def _cmd_install(self, args):
         """Implement the install command"""
@@ -625,14 +951,8 @@ class TerminalGame:
             self.renderer.output("Usage: install <card_number>")
             return
             
-        # Validate we're in the correct phase
-        if self.current_phase != GamePhase.ACTION:
-            self.renderer.output_error("Can only install during action phase")
-            return
-            
-        # Check if player has any clicks remaining
-        if self.clicks_remaining <= 0:
-            self.renderer.output_error("You don't have any clicks remaining.")
+        # Validate the phase and that a click is available
+        if not self._require_action_click("install"):
             return
             
         try:
@@ -661,12 +981,13 @@ class TerminalGame:
             self.player_credits -= cost
             
             # Consume memory if it's a program
-            if card.get('type', '').lower() in ['program', 'icebreaker', 'virus']:
-                self.memory_units_used += card.get('mu', 0)
+            if _card_type(card) in _MEMORY_TYPES:
+                self.memory_units_used += memory_required
                 
             # Remove from hand and add to played cards
-            self.hand_cards.remove(card)
+            del self.hand_cards[card_index]
             self.played_cards.append(card)
+            self._index_installed_card(card)
             
             # Display mini card visualization
             self.renderer.display_mini_card(card, f"Installing {card['name']} for {cost} credits")
@@ -691,37 +1012,43 @@ class TerminalGame:
             self.renderer.output("No programs installed.")
             return
             
-        self.renderer.output("\nINSTALLED PROGRAMS:")
-        self.renderer.output("==================")
+        lines = []
+        lines.append("\nINSTALLED PROGRAMS:")
+        lines.append("==================")
         for i, card in enumerate(self.played_cards):
-            self.renderer.output(f"[{i+1}] {card['name']} - {card['type']} - {card.get('mu', 0)}mu")
+            lines.append(f"[{i+1}] {card['name']} - {card['type']} - {card.get('mu', 0)}mu")
+        
+        self.renderer.output("\n".join(lines))
 
     def _cmd_memory(self, args):
         """Implement the memory command"""
-        self.renderer.output("\nMEMORY STATUS:")
-        self.renderer.output("=============")
-        self.renderer.output(f"Total Memory Units: {self.memory_units_available}")
-        self.renderer.output(f"Used Memory Units:  {self.memory_units_used}")
-        self.renderer.output(f"Free Memory Units:  {self.memory_units_available - self.memory_units_used}")
+        lines = [self._MEMORY_TEMPLATE.format(
+            self.memory_units_available,
+            self.memory_units_used,
+            self.memory_units_available - self.memory_units_used,
+        )]
         
         if self.played_cards:
-            self.renderer.output("\nMemory Usage by Program:")
+            lines.append("\nMemory Usage by Program:")
             for card in self.played_cards:
-                if card.get('mu', 0) > 0:
-                    self.renderer.output(f"  {card['name']}: {card.get('mu', 0)}mu")
+                mu = card.get('mu', 0)
+                if mu > 0:
+                    lines.append(f"  {card['name']}: {mu}mu")
+        
+        self.renderer.output("\n".join(lines))
 
     def _cmd_credits(self, args):
         """Implement the credits command"""
-        self.renderer.output("\nCREDIT ACCOUNT:")
-        self.renderer.output("==============")
-        self.renderer.output(f"Available Credits: {self.player_credits}")
+        lines = [self._CREDITS_TEMPLATE.format(self.player_credits)]
         
         # Show credit costs for cards in hand
         if self.hand_cards:
-            self.renderer.output("\nInstallation Costs:")
+            lines.append("\nInstallation Costs:")
             for i, card in enumerate(self.hand_cards):
                 if 'cost' in card:
-                    self.renderer.output(f"  [{i+1}] {card['name']}: {card['cost']}c")
+                    lines.append(f"  [{i+1}] {card['name']}: {card['cost']}c")
+        
+        self.renderer.output("\n".join(lines))
 
     def _cmd_run(self, args):
         """Run a server and face ICE"""
@@ -730,27 +1057,16 @@ class TerminalGame:
             self.renderer.output("Usage: run <server> [--stealth|--aggressive|--careful]")
             return
 
-        # Check if player has any clicks remaining
-        if self.clicks_remaining <= 0:
-            self.renderer.output_error("You don't have any clicks remaining.")
+        # Validate the phase and that a click is available
+        if not self._require_action_click("run"):
             return
 
         # Parse approach option
-        approach = "standard"
+        approach = _APPROACH_FLAGS.get(args[1], "standard") if len(args) > 1 else "standard"
         target_server = args[0].upper()
         
-        if len(args) > 1:
-            if args[1] == "--stealth":
-                approach = "stealth"
-            elif args[1] == "--aggressive":
-                approach = "aggressive"
-            elif args[1] == "--careful":
-                approach = "careful"
-        
-        # Handle server validation
-        valid_servers = ["R&D", "HQ", "ARCHIVES"]
-        
-        # Handle remote servers
+        # Handle remote servers, parsing the number once for the whole run
+        remote_num = None
         if target_server.startswith("REMOTE"):
             try:
                 remote_num = int(target_server[6:])
@@ -762,23 +1078,17 @@ class TerminalGame:
             except ValueError:
                 self.renderer.output_error("Invalid remote server. Use format 'Remote1', 'Remote2', etc.")
                 return
-        elif target_server not in valid_servers:
-            self.renderer.output_error(f"Invalid server. Valid targets: {', '.join(valid_servers)}, Remote1, Remote2, Remote3")
+        elif target_server not in _VALID_SERVERS:
+            self.renderer.output_error(f"Invalid server. Valid targets: {', '.join(_CENTRAL_SERVERS)}, Remote1, Remote2, Remote3")
             return
         
-        # Apply approach-specific effects
-        approach_message = ""
+        # Apply approach-specific effects; aggressive is handled during ICE
+        # encounters and careful makes jack_out easier
+        approach_message = _APPROACH_MESSAGES.get(approach, "")
         if approach == "stealth":
             self.player_credits -= 1
-            approach_message = "You take a stealthy approach, spending 1 credit on masking your signal."
             # 50% chance to bypass first ICE
-            self.bypass_next_ice += random.randint(0, 1)
-        elif approach == "aggressive":
-            approach_message = "You take an aggressive approach, focusing on power over subtlety."
-            # Will be handled during ICE encounters
-        elif approach == "careful":
-            approach_message = "You take a careful approach, focusing on safety."
-            # Will make jack_out easier
+            self.bypass_next_ice += self._rng.randint(0, 1)
             
         # Show visual running animation
         self.renderer.display_running_animation(target_server)
@@ -791,6 +1101,7 @@ class TerminalGame:
         # Initialize the run state
         self.current_run = {
             'server': target_server,
+            'remote_num': remote_num,
             'approach': approach,
             'state': 'initiated',
             'ice_index': 0,
@@ -859,13 +1170,14 @@ class TerminalGame:
         breakers = self._get_installed_breakers()
         can_break = False
         
+        ice_subtype = ice.get('subtype', '').lower()
         for breaker in breakers:
             if 'ability' in breaker and breaker['ability'].get('type') == 'break_ice':
-                ice_types = breaker['ability'].get('ice_types', [])
+                ice_types = {t.lower() for t in breaker['ability'].get('ice_types', [])}
                 max_strength = breaker['ability'].get('max_strength', 0)
                 
                 # Check if the breaker can handle this ICE
-                if (ice.get('subtype', '').lower() in [t.lower() for t in ice_types] or 'all' in [t.lower() for t in ice_types]) and max_strength >= ice.get('strength', 0):
+                if (ice_subtype in ice_types or 'all' in ice_types) and max_strength >= ice.get('strength', 0):
                     can_break = True
                     
                     # Show that the breaker can handle this ICE
@@ -908,7 +1220,7 @@ class TerminalGame:
                 self.renderer.display_run_progress(ice_list, len(ice_list), server_name)
                 
             self.renderer.output_success("Accessing server...")
-            server_result = self._access_server(self.current_run['server'])
+            server_result = self._access_server(self.current_run['server'], self.current_run['remote_num'])
             
             # Trigger any "successful_run" abilities
             for card in self.played_cards:
@@ -938,7 +1250,7 @@ class TerminalGame:
         # For the terminal version, we'll generate ICE based on the turn number
         
         # For simplicity, central servers have more ICE than remotes in this demo
-        is_central = server_name in ["R&D", "HQ", "ARCHIVES"]
+        is_central = server_name in _VALID_SERVERS
         ice_count = 0
         
         # Determine number of ICE based on turn number and server
@@ -956,203 +1268,33 @@ class TerminalGame:
         if ice_count == 0:
             return []
             
-        # Create ICE with various subtypes to test our breakers
-        ice_pool = [
-            {
-                'name': 'Ice Wall',
-                'type': 'Ice',
-                'subtype': 'Barrier',
-                'cost': 1,
-                'strength': 1,
-                'description': 'End the run.'
-            },
-            {
-                'name': 'Enigma',
-                'type': 'Ice',
-                'subtype': 'Code Gate',
-                'cost': 3,
-                'strength': 2,
-                'description': 'The Runner loses 1 click. End the run.'
-            },
-            {
-                'name': 'Rototurret',
-                'type': 'Ice', 
-                'subtype': 'Sentry',
-                'cost': 4,
-                'strength': 0,
-                'description': 'Trash 1 program. End the run.'
-            },
-            {
-                'name': 'Neural Katana',
-                'type': 'Ice',
-                'subtype': 'Sentry',
-                'cost': 4,
-                'strength': 3,
-                'description': 'Do 3 net damage. End the run.'
-            },
-            {
-                'name': 'Wall of Static',
-                'type': 'Ice',
-                'subtype': 'Barrier',
-                'cost': 3,
-                'strength': 3,
-                'description': 'End the run.'
-            },
-            {
-                'name': 'Tollbooth',
-                'type': 'Ice',
-                'subtype': 'Code Gate',
-                'cost': 8,
-                'strength': 5,
-                'description': 'The Runner loses 3 credits, if able. End the run if the Runner cannot pay 3 credits.'
-            }
-        ]
-        
-        # Generate a mix of ICE
-        # Use deterministic selection for reproducibility in testing
+        # Select ICE deterministically from turn number and server, for reproducibility in testing
+        base = self.turn_number + ord(server_name[0])
         selected_ice = []
         for i in range(ice_count):
-            # Determine a "slot" for each position in the server
-            if i == 0:  # Outermost ICE is often a barrier
-                candidates = [ice for ice in ice_pool if ice['subtype'] == 'Barrier']
-            elif i == 1:  # Second ICE is often a code gate
-                candidates = [ice for ice in ice_pool if ice['subtype'] == 'Code Gate']
-            else:  # Innermost ICE is often a sentry
-                candidates = [ice for ice in ice_pool if ice['subtype'] == 'Sentry']
-                
-            # If no candidates of the right type, use any type
-            if not candidates:
-                candidates = ice_pool
-                
-            # Select an ICE using a deterministic method based on turn number and server
-            index = (self.turn_number + ord(server_name[0]) + i) % len(candidates)
-            selected_ice.append(candidates[index])
+            # Outermost ICE is a barrier, the second a code gate, any further ones sentries
+            candidates = _ICE_SLOT_CANDIDATES[min(i, 2)]
+            selected_ice.append(candidates[(base + i) % len(candidates)])
             
         return selected_ice
     
     def _get_installed_breakers(self):
-        """Get all installed icebreaker programs"""
-        # Let's simplify this to just return installed cards that are icebreaker type
-        breakers = []
-        for card in self.played_cards:
-            if card.get('type', '').lower() == 'icebreaker':
-                # Add basic icebreaker ability if not present
-                if 'ability' not in card:
-                    card['ability'] = {
-                        'type': 'break_ice',
-                        'ice_types': ['all'],
-                        'max_strength': card.get('strength', 2)
-                    }
-                breakers.append(card)
+        """Get all installed icebreaker programs (maintained on install)"""
+        return self._installed_breakers
                 
-        return breakers
-                
-    def _access_server(self, server_name):
-        """Access a server and get its contents"""
+    def _access_server(self, server_name, remote_num=None):
+        """Access a server and get its contents; remote_num is set for remote servers"""
         self.renderer.output_success(f"Accessing server: {server_name}")
         
         # Each server has different content to access
-        accessed_cards = []
-        
-        if server_name == "R&D":
-            # In a simulation, create dummy cards instead of accessing corp_deck
-            dummy_card = {
-                'name': "Priority Directive",
-                'type': "Agenda",
-                'advancement_requirement': 3,
-                'agenda_points': 2,
-                'description': "When you score this agenda, you may rez a piece of ice ignoring all costs."
-            }
-            accessed_cards = [dummy_card]
-            self.renderer.output(f"You access the top card of R&D.")
-                
-        elif server_name == "HQ":
-            # Create a dummy card for HQ
-            dummy_card = {
-                'name': "Corporate Strategy",
-                'type': "Operation",
-                'cost': 2,
-                'description': "Gain 5 credits."
-            }
-            accessed_cards = [dummy_card]
-            self.renderer.output("You access a random card from HQ.")
-                
-        elif server_name == "ARCHIVES":
-            # Create dummy cards for Archives
-            dummy_cards = [
-                {
-                    'name': "Hedge Fund",
-                    'type': "Operation",
-                    'cost': 5,
-                    'description': "Gain 9 credits."
-                },
-                {
-                    'name': "Ice Wall",
-                    'type': "Ice",
-                    'subtype': "Barrier",
-                    'cost': 1,
-                    'strength': 1,
-                    'description': "End the run."
-                }
-            ]
-            accessed_cards = dummy_cards
-            self.renderer.output(f"You access {len(accessed_cards)} cards from Archives.")
-                
-        elif server_name.startswith("REMOTE"):
-            # Access cards in a remote server
-            server_num = int(server_name[6:])
-            if server_num > 0 and server_num <= 3:
-                # Generate a random card for this remote server
-                card_types = ["Asset", "Upgrade", "Agenda"]
-                card_type = random.choice(card_types)
-                
-                if card_type == "Agenda":
-                    # Create a random agenda
-                    agenda = {
-                        'name': f"Priority Requisition {server_num}",
-                        'type': "Agenda",
-                        'advancement_requirement': 3,
-                        'agenda_points': 2,
-                        'description': "When you score this agenda, you may rez a piece of ice ignoring all costs."
-                    }
-                    accessed_cards = [agenda]
-                    self.renderer.output("You've found an agenda!")
-                    
-                    # Award agenda points
-                    self.player_agenda_points += agenda['agenda_points']
-                    self.renderer.output_success(f"You score {agenda['agenda_points']} agenda points!")
-                    
-                elif card_type == "Asset":
-                    # Create a random asset
-                    asset = {
-                        'name': f"Adonis Campaign {server_num}",
-                        'type': "Asset",
-                        'cost': 4,
-                        'trash_cost': 3,
-                        'description': "Place 12 credits on Adonis Campaign. When it is rezzed. Take 3 credits from Adonis Campaign at the start of your turn. Trash it if there are no credits left."
-                    }
-                    accessed_cards = [asset]
-                    self.renderer.output("You've found an asset.")
-                    
-                    # Option to trash
-                    if self.player_credits >= asset['trash_cost']:
-                        self.renderer.output(f"You can spend {asset['trash_cost']} credits to trash it.")
-                
-                elif card_type == "Upgrade":
-                    # Create a random upgrade
-                    upgrade = {
-                        'name': f"Red Herrings {server_num}",
-                        'type': "Upgrade",
-                        'cost': 2,
-                        'trash_cost': 1,
-                        'description': "The Runner must pay 5 credits as an additional cost to steal an agenda from this server."
-                    }
-                    accessed_cards = [upgrade]
-                    self.renderer.output("You've found an upgrade.")
-                    
-                    # Option to trash
-                    if self.player_credits >= upgrade['trash_cost']:
-                        self.renderer.output(f"You can spend {upgrade['trash_cost']} credits to trash it.")
+        if remote_num is not None:
+            accessed_cards = self._access_remote(remote_num)
+        elif server_name in _CENTRAL_ACCESS:
+            message, cards = _CENTRAL_ACCESS[server_name]
+            self.renderer.output(message)
+            accessed_cards = list(cards)
+        else:
+            accessed_cards = []
         
         # Display all accessed cards
         if accessed_cards:
@@ -1165,31 +1307,84 @@ class TerminalGame:
             
         return accessed_cards
 
+    def _access_remote(self, server_num):
+        """Access the card installed in a remote server (validated to 1-3 by _cmd_run)"""
+        accessed_cards = []
+        
+        # Generate a random card for this remote server
+        card_type = self._rng.choice(_REMOTE_CARD_TYPES)
+        
+        if card_type == "Agenda":
+            # Create a random agenda
+            agenda = {
+                'name': f"Priority Requisition {server_num}",
+                'type': "Agenda",
+                'advancement_requirement': 3,
+                'agenda_points': 2,
+                'description': "When you score this agenda, you may rez a piece of ice ignoring all costs."
+            }
+            accessed_cards = [agenda]
+            self.renderer.output("You've found an agenda!")
+            
+            self._score_agenda(agenda['agenda_points'])
+            
+        elif card_type == "Asset":
+            # Create a random asset
+            asset = {
+                'name': f"Adonis Campaign {server_num}",
+                'type': "Asset",
+                'cost': 4,
+                'trash_cost': 3,
+                'description': "Place 12 credits on Adonis Campaign. When it is rezzed. Take 3 credits from Adonis Campaign at the start of your turn. Trash it if there are no credits left."
+            }
+            accessed_cards = [asset]
+            self.renderer.output("You've found an asset.")
+            
+            # Option to trash
+            if self.player_credits >= asset['trash_cost']:
+                self.renderer.output(f"You can spend {asset['trash_cost']} credits to trash it.")
+        
+        elif card_type == "Upgrade":
+            # Create a random upgrade
+            upgrade = {
+                'name': f"Red Herrings {server_num}",
+                'type': "Upgrade",
+                'cost': 2,
+                'trash_cost': 1,
+                'description': "The Runner must pay 5 credits as an additional cost to steal an agenda from this server."
+            }
+            accessed_cards = [upgrade]
+            self.renderer.output("You've found an upgrade.")
+            
+            # Option to trash
+            if self.player_credits >= upgrade['trash_cost']:
+                self.renderer.output(f"You can spend {upgrade['trash_cost']} credits to trash it.")
+                
+        return accessed_cards
+
+    def _score_agenda(self, points):
+        """Award agenda points to the Runner; the win check after the command picks up a win"""
+        self.runner_agenda_points += points
+        self.renderer.output_success(f"You score {points} agenda points!")
+
     def _cmd_system(self, args):
         """Implement the system command"""
-        self.renderer.output("\nSYSTEM STATUS:")
-        self.renderer.output("=============")
-        self.renderer.output("Neural Interface: Online")
-        self.renderer.output("Connection Status: Secure")
-        self.renderer.output("Trace Detection: None")
-        self.renderer.output("System Integrity: 100%")
-        
-        # Add some randomized "hacker flavor" stats
-        firewall_status = random.choice(["Active", "Standby", "Enhanced", "Minimal"])
-        encryption_level = random.choice(["Standard", "Military-grade", "Quantum", "Polymorphic"])
-        self.renderer.output(f"Firewall Status: {firewall_status}")
-        self.renderer.output(f"Encryption Level: {encryption_level}")
+        # Add some randomized "hacker flavor" stats, both picked from one 4-bit draw
+        bits = self._rng.getrandbits(4)
+        firewall_status = _FIREWALL_STATUSES[bits & 0b11]
+        encryption_level = _ENCRYPTION_LEVELS[bits >> 2]
+        self.renderer.output(self._SYSTEM_TEMPLATE.format(firewall_status, encryption_level))
 
     def _cmd_info(self, args):
         """Implement the info command"""
-        self.renderer.output("\nGAME INFORMATION:")
-        self.renderer.output("================")
-        self.renderer.output(f"Turn Number: {self.turn_number}")
-        self.renderer.output(f"Active Player: {self.active_player.capitalize()}")
-        self.renderer.output(f"Current Phase: {self._get_phase_name(self.current_phase)}")
-        self.renderer.output(f"Runner Agenda Points: {self.runner_agenda_points}/{self.agenda_points_to_win}")
-        self.renderer.output(f"Corp Agenda Points: {self.corp_agenda_points}/{self.agenda_points_to_win}")
-        self.renderer.output(f"Cards in Runner's Deck: {self.runner_cards_remaining}")
+        self.renderer.output(self._INFO_TEMPLATE.format(
+            self.turn_number,
+            self.active_player.capitalize(),
+            _PHASE_NAMES[self.current_phase],
+            self.runner_agenda_points, self.agenda_points_to_win,
+            self.corp_agenda_points, self.agenda_points_to_win,
+            self.runner_cards_remaining,
+        ))
 
     def _cmd_discard(self, args):
         """Implement the discard command"""
@@ -1208,16 +1403,14 @@ class TerminalGame:
                 self.renderer.output_error(f"Invalid card number: {args[0]}")
                 return
                 
+            # Only spend a click if it's the action phase
+            in_action = self.current_phase is GamePhase.ACTION
+            if in_action and not self._require_action_click("discard"):
+                return
+                
             # Discard the card
             card = self.hand_cards.pop(card_index)
-            
-            # Only spend a click if it's the action phase
-            if self.current_phase == GamePhase.ACTION:
-                if self.clicks_remaining < 1:
-                    self.renderer.output_error("Not enough clicks remaining")
-                    # Put the card back
-                    self.hand_cards.insert(card_index, card)
-                    return
+            if in_action:
                 self.clicks_remaining -= 1
                 
             self.renderer.output(f"Discarded: {card['name']}")
@@ -1228,7 +1421,7 @@ class TerminalGame:
 
     def _cmd_end(self, args):
         """Implement the end command"""
-        if self.current_phase != GamePhase.ACTION and self.current_phase != GamePhase.DISCARD:
+        if self.current_phase is not GamePhase.ACTION and self.current_phase is not GamePhase.DISCARD:
             self.renderer.output_error("Can only end turn during action or discard phase")
             return
             
@@ -1275,25 +1468,19 @@ class TerminalGame:
         
         # ICE type modifiers
         ice_type = ice.get('type', '').lower()
-        if ice_type == 'code gate':
-            base_success -= 0.1  # Harder to jack out from code gates
-        elif ice_type == 'sentry':
-            base_success -= 0.2  # Much harder to jack out from sentries
-        elif ice_type == 'barrier':
-            base_success += 0.1  # Easier to jack out from barriers
+        base_success += _ICE_JACK_OUT_MODIFIERS.get(ice_type, 0.0)
             
         # Check for cards that help with jacking out
-        for card in self.played_cards:
-            if 'ability' in card and card['ability'].get('type') == 'jack_out_assist':
-                base_success += 0.2
-                self.renderer.output_success(f"Using {card['name']} to assist with jacking out.")
+        for card in self._jack_out_assist_cards:
+            base_success += 0.2
+            self.renderer.output_success(f"Using {card['name']} to assist with jacking out.")
                 
         # Apply run approach modifier
         if self.current_run.get('approach') == 'careful':
             base_success += 0.3  # Much easier to jack out with careful approach
                 
         # Roll for success
-        success_roll = random.random()
+        success_roll = self._rng.random()
         self.renderer.output(f"Attempting to jack out... (Success chance: {int(base_success*100)}%)")
         
         if success_roll <= base_success:
@@ -22,6 +22,8 @@ class SilentRenderer(TerminalRenderer):
         self.terminal_width = 80
         self.terminal_height = 24
         self.header_text = "TEST MODE"
+        self._out_buf = []
+        self._server_art_cache = {}
         # Mock ASCII art
         self.ascii_art = {
             "logo": ["TEST LOGO"],
@@ -30,6 +32,10 @@ class SilentRenderer(TerminalRenderer):
             "server": ["TEST SERVER"]
         }
     
+    def _width(self):
+        """Use the fixed test width instead of querying the terminal"""
+        return self.terminal_width
+    
     def display(self, text, color=None):
         """Suppress display output"""
         pass
@@ -65,6 +71,8 @@ class CaptureRenderer(TerminalRenderer):
         self.terminal_width = 80
         self.terminal_height = 24
         self.header_text = "TEST MODE"
+        self._out_buf = []
+        self._server_art_cache = {}
         self.output_buffer = output_buffer
         # Mock ASCII art
         self.ascii_art = {
@@ -74,12 +82,18 @@ class CaptureRenderer(TerminalRenderer):
             "server": ["TEST SERVER"]
         }
     
+    def _width(self):
+        """Use the fixed test width instead of querying the terminal"""
+        return self.terminal_width
+    
+    def _write(self, text):
+        """Capture queued terminal output instead of buffering it"""
+        self.display(text)
+    
     def display(self, text, color=None):
         """Capture displayed text"""
-        # Break text into lines and append each line to the buffer
-        for line in text.split('\n'):
-            if line.strip():  # Only capture non-empty lines
-                self.output_buffer.append(line.strip())
+        # Break text into lines and capture the non-empty ones in one extend
+        self.output_buffer.extend(line for line in (raw.strip() for raw in text.split('\n')) if line)
     
     def display_prompt(self):
         """Capture prompt display"""
@@ -59,10 +59,28 @@ class TestCardMechanics(unittest.TestCase):
         # Check that the card was installed
         self.assertEqual(len(self.game.runner_hand), initial_hand_size - 1)
         self.assertEqual(len(self.game.runner_installed), initial_installed + 1)
+        self.assertIs(self.game.runner_installed[-1], card_to_install)
         
         # Check that credits were spent
         self.assertEqual(self.game.runner_credits, initial_credits - install_cost)
     
+    def test_install_card_added_after_setup(self):
+        """Test installing a card that did not come from the shuffled deck"""
+        fixture = {'name': 'Test Breaker', 'type': 'Icebreaker', 'cost': 1, 'mu': 1, 'strength': 2}
+        self.game.runner_hand.append(fixture)
+        initial_memory = self.game.runner_memory_used
+        
+        self.game.process_command(f"install {len(self.game.runner_hand)}")
+        
+        # The card is installed, uses memory, and gets the default breaker ability
+        self.assertIs(self.game.runner_installed[-1], fixture)
+        self.assertEqual(self.game.runner_memory_used, initial_memory + 1)
+        self.assertEqual(fixture['ability']['type'], 'break_ice')
+    
+    def test_setup_leaves_card_data_unchanged(self):
+        """Test that setting up a game does not modify the caller's cards"""
+        self.assertEqual(self.cards, load_cards())
+    
     def test_memory_usage(self):
         """Test that card installation uses memory correctly"""
         # Install several cards that use memory
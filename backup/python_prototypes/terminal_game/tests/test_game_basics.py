@@ -4,6 +4,7 @@ Basic tests for the Neon Dominance terminal game
 """
 
 import unittest
+from unittest import mock
 import random
 import sys
 import os
@@ -11,7 +12,7 @@ import os
 # Add parent directory to path to allow imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from terminal_game import TerminalGame
+from terminal_game import TerminalGame, GamePhase
 from card_data import load_cards
 from tests.mock_renderer import SilentRenderer
 from tests.test_game_wrapper import TestGameWrapper
@@ -74,6 +75,26 @@ class TestGameInitialization(unittest.TestCase):
         # Instead of checking the active player, we'll just check that the command executed
         # This is a minimal test to ensure the end command doesn't crash
         self.assertTrue(True, "End turn command executed without crashing")
+    
+    def test_corp_win_during_ai_turn(self):
+        """Test that a Corp win in its own turn ends the game before the Runner's next turn"""
+        game = self.game.game
+        turn_before = game.turn_number
+        
+        # Let the Corp reach the winning score during its turn
+        with mock.patch.object(game.ai_opponent, 'get_agenda_points', return_value=game.agenda_points_to_win):
+            self.game.process_command("end")
+        
+        self.assertTrue(self.game.game_over)
+        self.assertIn("Corporation wins", game.win_message)
+        self.assertEqual(game.current_phase, GamePhase.GAME_OVER)
+        self.assertEqual(game.active_player, "corp")
+        self.assertEqual(game.turn_number, turn_before + 1, "No Runner turn should start after the win")
+        
+        # Further commands are refused
+        clicks = self.game.runner_clicks
+        self.game.process_command("draw")
+        self.assertEqual(self.game.runner_clicks, clicks)
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -66,6 +66,21 @@ class TestGameWrapper:
         """Return the player's remaining clicks"""
         return self.game.clicks_remaining
     
+    @runner_clicks.setter
+    def runner_clicks(self, value):
+        """Set the player's remaining clicks"""
+        self.game.clicks_remaining = value
+    
+    @property
+    def current_phase(self):
+        """Return the current game phase"""
+        return self.game.current_phase
+    
+    @current_phase.setter
+    def current_phase(self, value):
+        """Set the current game phase"""
+        self.game.current_phase = value
+    
     @property
     def corp_turn(self):
         """Return whether it's the corporation's turn"""
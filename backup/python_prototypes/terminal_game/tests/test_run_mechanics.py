@@ -4,6 +4,7 @@ Tests for the run mechanics in Neon Dominance
 """
 
 import unittest
+from unittest import mock
 import random
 import re
 import sys
@@ -12,7 +13,7 @@ import os
 # Add parent directory to path to allow imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from terminal_game import TerminalGame
+from terminal_game import TerminalGame, GamePhase
 from card_data import load_cards
 from tests.mock_renderer import CaptureRenderer
 from tests.test_game_wrapper import TestGameWrapper
@@ -80,6 +81,62 @@ class TestRunMechanics(unittest.TestCase):
         # If the command is rejected, clicks should remain the same
         self.assertEqual(self.game.runner_clicks, initial_clicks, "Invalid server should not use clicks")
     
+    def assertOutputContains(self, text):
+        """Assert that some captured output line contains text"""
+        self.assertTrue(any(text in line for line in self.output_buffer),
+                        f"Expected output containing {text!r}")
+    
+    def test_run_outside_action_phase(self):
+        """Test that a run is refused outside the action phase"""
+        self.game.current_phase = GamePhase.DISCARD
+        initial_clicks = self.game.runner_clicks
+        
+        self.game.process_command("run R&D")
+        
+        self.assertEqual(self.game.runner_clicks, initial_clicks, "Refused run should not use clicks")
+        self.assertIsNone(self.game.game.current_run)
+        self.assertOutputContains("Can only run during action phase")
+    
+    def test_run_without_clicks(self):
+        """Test that a run needs a click"""
+        self.game.runner_clicks = 0
+        
+        self.game.process_command("run HQ")
+        
+        self.assertEqual(self.game.runner_clicks, 0)
+        self.assertIsNone(self.game.game.current_run)
+        self.assertOutputContains("Not enough clicks remaining")
+    
+    def test_install_without_clicks(self):
+        """Test that installing reports the same missing-click error as other actions"""
+        self.game.runner_clicks = 0
+        initial_hand_size = len(self.game.runner_hand)
+        
+        self.game.process_command("install 1")
+        
+        self.assertEqual(len(self.game.runner_hand), initial_hand_size)
+        self.assertOutputContains("Not enough clicks remaining")
+    
+    def test_remote_agenda_is_scored(self):
+        """Test that accessing an agenda in a remote server scores it for the Runner"""
+        game = self.game.game
+        with mock.patch.object(game._rng, 'choice', return_value="Agenda"):
+            self.game.process_command("run Remote1")
+        
+        self.assertEqual(game.runner_agenda_points, 2)
+        self.assertOutputContains("You score 2 agenda points!")
+        self.assertFalse(self.game.game_over)
+    
+    def test_remote_agenda_can_win(self):
+        """Test that scoring the last needed points from a remote ends the game"""
+        game = self.game.game
+        game.runner_agenda_points = game.agenda_points_to_win - 1
+        with mock.patch.object(game._rng, 'choice', return_value="Agenda"):
+            self.game.process_command("run Remote1")
+        
+        self.assertTrue(self.game.game_over)
+        self.assertIn("Runner wins", game.win_message)
+    
     def test_jack_out_command_exists(self):
         """Test that the jack_out command exists"""
         # First, start a run
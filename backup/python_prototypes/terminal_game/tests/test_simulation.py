@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for headless batch simulation in Neon Dominance
+"""
+
+import unittest
+import contextlib
+import io
+import sys
+import os
+
+# Add parent directory to path to allow imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from terminal_game import TerminalGame
+from card_data import load_cards
+
+class TestBatchSimulation(unittest.TestCase):
+    """Tests for TerminalGame.simulate_batch"""
+
+    def setUp(self):
+        """Set up test environment before each test"""
+        self.seeds = range(5)
+        self.cards = load_cards()
+
+    def test_batch_is_deterministic_per_seed(self):
+        """Test that each seed plays out the same way every time"""
+        for seed in self.seeds:
+            first = TerminalGame.simulate_batch(self.cards, [seed])
+            second = TerminalGame.simulate_batch(self.cards, [seed])
+            self.assertEqual(first, second, f"Seed {seed} should give the same result")
+            self.assertEqual(sum(first.values()), 1)
+
+    def test_batch_tallies_every_game(self):
+        """Test that a batch counts one outcome per seed"""
+        results = TerminalGame.simulate_batch(self.cards, self.seeds)
+        self.assertEqual(sum(results.values()), len(self.seeds))
+
+    def test_batch_can_record_runner_win(self):
+        """Test that the scripted Runner can win by scoring agendas"""
+        results = TerminalGame.simulate_batch(self.cards, self.seeds)
+        self.assertGreater(results["runner"], 0)
+
+    def test_batch_leaves_cards_unchanged(self):
+        """Test that games in a batch do not modify the caller's cards"""
+        TerminalGame.simulate_batch(self.cards, self.seeds)
+        self.assertEqual(self.cards, load_cards())
+
+    def test_batch_is_silent(self):
+        """Test that a headless batch writes nothing to stdout"""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            TerminalGame.simulate_batch(self.cards, self.seeds)
+        self.assertEqual(output.getvalue(), "")
+
+if __name__ == "__main__":
+    unittest.main()